@@ -6,7 +6,7 @@ import json
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from geoalchemy2.functions import ST_AsGeoJSON, ST_GeomFromGeoJSON
+from geoalchemy2.functions import ST_AsGeoJSON, ST_Force2D, ST_GeomFromGeoJSON
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -69,7 +69,9 @@ async def get_links(
                 link.speed_records.count() if hasattr(link, "speed_records") else 0
             ),
         }
-        response_links.append(LinkResponse(**response_data))
+        # Values come straight from the ORM row; FastAPI validates the
+        # response against response_model, so skip a second validation here
+        response_links.append(LinkResponse.model_construct(**response_data))
 
     logger.info(f"Returned {len(response_links)} links")
     return response_links
@@ -132,7 +134,8 @@ async def get_link(
     }
 
     logger.info(f"Successfully retrieved link with ID {link_id}")
-    return LinkResponse(**response_data)
+    # Trusted ORM values; response_model validation still applies on the way out
+    return LinkResponse.model_construct(**response_data)
 
 
 @router.post(
@@ -173,8 +176,9 @@ async def create_link(
     geometry_value = None
     if link.geometry:
         try:
-            geometry_json = json.dumps(link.geometry)
-            geometry_value = ST_GeomFromGeoJSON(geometry_json)
+            geometry_json = link.geometry.model_dump_json()
+            # The column is 2D, so drop the elevation of 3D positions
+            geometry_value = ST_Force2D(ST_GeomFromGeoJSON(geometry_json))
             logger.debug(f"Converted geometry for link_id={link.link_id}")
         except Exception as e:
             logger.error(
@@ -203,7 +207,8 @@ async def create_link(
             "length": db_link.length,
             "road_type": db_link.road_type,
             "speed_limit": db_link.speed_limit,
-            "geometry": link.geometry,  # Return original dict from request
+            # Return the geometry from the request as a GeoJSON dict
+            "geometry": link.geometry.model_dump() if link.geometry else None,
             "speed_records_count": 0,  # New link has no speed records yet
         }
 
@@ -64,8 +64,9 @@ def get_engine() -> Engine:
         # Validate database URL
         _validate_database_url(settings.database_url)
 
-        # Configure connect_args based on database type
+        # Configure connect_args and dialect options based on database type
         connect_args = {}
+        dialect_options = {}
         database_url = settings.database_url.lower()
 
         if database_url.startswith("sqlite"):
@@ -80,6 +81,12 @@ def get_engine() -> Engine:
                 "connect_timeout": 10,  # Connection timeout
                 "application_name": "geoapi",  # For monitoring/debugging
             }
+            # Multi-row INSERT ... VALUES pages, execute_batch for UPDATE/DELETE
+            dialect_options = {
+                "executemany_mode": "values_plus_batch",
+                "insertmanyvalues_page_size": 1000,
+                "executemany_batch_page_size": 1000,
+            }
 
         _engine = create_engine(
             settings.database_url,
@@ -87,6 +94,7 @@ def get_engine() -> Engine:
             pool_pre_ping=True,  # Verify connections before use
             pool_recycle=3600,  # Recycle connections every hour (was 300s)
             connect_args=connect_args,
+            **dialect_options,
         )
     return _engine
 
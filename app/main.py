@@ -4,6 +4,7 @@ FastAPI main application.
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1 import aggregates, links
 from app.core.config import get_settings
@@ -24,6 +25,7 @@ app = FastAPI(
     version=settings.app_version,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # orjson instead of stdlib json
 )
 
 # Add CORS middleware
@@ -3,7 +3,7 @@ Link model representing road segments with spatial geometry.
 """
 
 from geoalchemy2 import Geometry
-from sqlalchemy import Column, Float, Index, Integer, String
+from sqlalchemy import Column, Computed, Float, Index, Integer, String, text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -21,6 +21,7 @@ class Link(Base):
         geometry: Road segment geometry as LINESTRING in WGS84
         road_name: Name or identifier of the road
         length: Length of the road segment in meters
+        length_m: Geometry length in meters, generated by PostGIS
         road_type: Type/classification of the road
         speed_limit: Speed limit for this road segment in mph
         speed_records: Related speed measurements for this link
@@ -50,6 +51,14 @@ class Link(Base):
 
     length = Column(Float, nullable=True, comment="Road length in meters")
 
+    # Computed once per row by PostGIS on write, so queries read it instead
+    # of reprojecting every geometry
+    length_m = Column(
+        Float,
+        Computed("ST_Length(ST_Transform(geometry, 3857))", persisted=True),
+        comment="Geometry length in meters (Web Mercator)",
+    )
+
     road_type = Column(String, nullable=True, comment="Type or classification of road")
 
     speed_limit = Column(Integer, nullable=True, comment="Speed limit in mph")
@@ -66,6 +75,12 @@ class Link(Base):
     __table_args__ = (
         Index("idx_link_geometry", "geometry", postgresql_using="gist"),
         Index("idx_link_road_name", "road_name"),
+        # Partial index holding only invalid geometries, empty when healthy
+        Index(
+            "idx_link_invalid_geometry",
+            "link_id",
+            postgresql_where=text("geometry IS NULL OR NOT ST_IsValid(geometry)"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -2,6 +2,16 @@
 Pydantic schemas for API serialization and validation.
 """
 
+from .geometry import (
+    Geometry,
+    LineString,
+    LinkGeometry,
+    MultiLineString,
+    Point,
+    Polygon,
+    SampledGeometry,
+    SampledLineString,
+)
 from .link import LinkBase, LinkCreate, LinkList, LinkResponse, LinkUpdate
 from .speed_record import (
     SpeedRecord,
@@ -12,6 +22,15 @@ from .speed_record import (
 )
 
 __all__ = [
+    # Geometry schemas
+    "Geometry",
+    "Point",
+    "LineString",
+    "MultiLineString",
+    "Polygon",
+    "SampledGeometry",
+    "SampledLineString",
+    "LinkGeometry",
     # Link schemas
     "LinkBase",
     "LinkCreate",
@@ -0,0 +1,160 @@
+"""
+Pydantic schemas for GeoJSON geometries.
+"""
+
+from itertools import chain
+from typing import Annotated, Any, List, Literal, Optional, Tuple, Union
+
+from pydantic import (
+    BaseModel,
+    Discriminator,
+    Field,
+    Tag,
+    TypeAdapter,
+    ValidationError,
+    model_validator,
+)
+
+# Longitude, latitude and optional elevation in WGS84
+Position = Annotated[Tuple[float, ...], Field(min_length=2, max_length=3)]
+
+# Geometries with more positions than this are only spot-checked
+MAX_VALIDATED_COORDINATES = 10_000
+
+# Leading coordinate entries validated for geometries above the limit
+GEOMETRY_SAMPLE_SIZE = 100
+
+
+class Point(BaseModel):
+    """GeoJSON Point geometry."""
+
+    type: Literal["Point"]
+    coordinates: Position
+
+
+class LineString(BaseModel):
+    """GeoJSON LineString geometry."""
+
+    type: Literal["LineString"]
+    coordinates: List[Position] = Field(min_length=2)
+
+
+class MultiLineString(BaseModel):
+    """GeoJSON MultiLineString geometry."""
+
+    type: Literal["MultiLineString"]
+    coordinates: List[List[Position]]
+
+
+class Polygon(BaseModel):
+    """GeoJSON Polygon geometry."""
+
+    type: Literal["Polygon"]
+    coordinates: List[List[Position]]
+
+
+# Geometries that may grow past MAX_VALIDATED_COORDINATES
+_SampledGeometryTypes = Annotated[
+    Union[LineString, MultiLineString, Polygon], Field(discriminator="type")
+]
+_sample_adapter = TypeAdapter(_SampledGeometryTypes)
+
+
+class SampledGeometry(BaseModel):
+    """
+    GeoJSON geometry too large to validate in full.
+
+    The type and the first GEOMETRY_SAMPLE_SIZE coordinate entries are
+    validated against the full schema; every other position only gets a
+    cheap structural check. The coordinate array is kept unchanged.
+    """
+
+    type: Literal["LineString", "MultiLineString", "Polygon"]
+    coordinates: List[Any]
+
+    @model_validator(mode="after")
+    def validate_sample(self) -> "SampledGeometry":
+        """Validate the leading coordinates against the full geometry schema."""
+        sample = {
+            "type": self.type,
+            "coordinates": self.coordinates[:GEOMETRY_SAMPLE_SIZE],
+        }
+        try:
+            _sample_adapter.validate_python(sample)
+        except ValidationError as e:
+            error = e.errors()[0]
+            location = ".".join(str(part) for part in error["loc"])
+            raise ValueError(f"{location}: {error['msg']}") from e
+
+        lines = [self.coordinates] if self.type == "LineString" else self.coordinates
+        for part, line in enumerate(lines):
+            if not is_position_list(line):
+                location = "" if self.type == "LineString" else f".{part}"
+                raise ValueError(
+                    f"{self.type}.coordinates{location}: "
+                    "Input should be a list of positions of 2 or 3 numbers"
+                )
+        return self
+
+
+class SampledLineString(SampledGeometry):
+    """GeoJSON LineString too large to validate in full."""
+
+    type: Literal["LineString"]
+
+
+def is_position_list(line: Any) -> bool:
+    """Check a value is a list of 2- or 3-number positions, without converting it."""
+    # Each set() iterates in C instead of checking positions one by one in Python
+    return (
+        isinstance(line, list)
+        and set(map(type, line)) <= {list}
+        and set(map(len, line)) <= {2, 3}
+        and set(map(type, chain.from_iterable(line))) <= {int, float}
+    )
+
+
+def count_positions(coordinates: Any) -> int:
+    """Count the positions in a GeoJSON coordinates array of any depth."""
+    if not isinstance(coordinates, list) or not coordinates:
+        return 0
+    first = coordinates[0]
+    if not isinstance(first, list):
+        return 1  # A single position
+    if first and isinstance(first[0], list):
+        return sum(count_positions(part) for part in coordinates)
+    return len(coordinates)
+
+
+def _geometry_tag(value: Any) -> Optional[str]:
+    """Return the union tag for a geometry, routing large inputs to SampledGeometry."""
+    if isinstance(value, dict):
+        if count_positions(value.get("coordinates")) > MAX_VALIDATED_COORDINATES:
+            return "Sampled"
+        return value.get("type")
+    if isinstance(value, SampledGeometry):
+        return "Sampled"
+    return getattr(value, "type", None)
+
+
+# Tagged union: pydantic dispatches on "type" instead of trying each member
+Geometry = Annotated[
+    Union[
+        Annotated[Point, Tag("Point")],
+        Annotated[LineString, Tag("LineString")],
+        Annotated[MultiLineString, Tag("MultiLineString")],
+        Annotated[Polygon, Tag("Polygon")],
+        Annotated[SampledGeometry, Tag("Sampled")],
+    ],
+    Discriminator(_geometry_tag),
+]
+
+
+# Link geometries: the links.geometry column only stores LineStrings
+LinkGeometry = Annotated[
+    Union[
+        Annotated[LineString, Tag("LineString")],
+        Annotated[SampledLineString, Tag("Sampled")],
+    ],
+    Discriminator(_geometry_tag),
+]
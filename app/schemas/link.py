@@ -6,6 +6,8 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from .geometry import LinkGeometry
+
 
 class LinkBase(BaseModel):
     """Base schema for Link with common fields."""
@@ -34,7 +36,7 @@ class LinkCreate(LinkBase):
     link_id: int = Field(
         description="Unique identifier for the road link", examples=[12345]
     )
-    geometry: Optional[Dict[str, Any]] = Field(
+    geometry: Optional[LinkGeometry] = Field(
         default=None, description="Road segment geometry as GeoJSON LineString in WGS84"
     )
 
@@ -42,7 +44,7 @@ class LinkCreate(LinkBase):
 class LinkUpdate(LinkBase):
     """Schema for updating an existing Link."""
 
-    geometry: Optional[Dict[str, Any]] = Field(
+    geometry: Optional[LinkGeometry] = Field(
         default=None, description="Road segment geometry as GeoJSON LineString in WGS84"
     )
 
@@ -4,36 +4,136 @@ Analyze the original Parquet data to understand structure and content.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from convert_compression import prefer_zstd
 from shapely.geometry import shape
 
+# Read the zstd copies written by convert_compression.py when available
+LINK_INFO_PATH = prefer_zstd("/workspace/data/raw/link_info.parquet.gz")
+SPEED_DATA_PATH = prefer_zstd("/workspace/data/raw/duval_jan1_2024.parquet.gz")
 
-def analyze_link_data():
-    """Analyze the link_info.parquet.gz dataset."""
+# Only these columns are decoded; the rest of the file is never read
+LINK_COLUMNS = ["link_id", "road_name", "_length", "geo_json"]
+SPEED_COLUMNS = ["link_id", "date_time", "period", "average_speed"]
+
+
+def load_projected_table(path, columns):
+    """
+    Load only the requested columns of a Parquet file as an Arrow table.
+
+    Args:
+        path: Parquet file path
+        columns: Column names to decode
+
+    Returns:
+        tuple: (full file schema, projected Arrow table)
+    """
+    table = pq.read_table(path, columns=columns, pre_buffer=True, use_threads=True)
+    return pq.read_schema(path), table
+
+
+def prefetch_tables():
+    """
+    Load both datasets concurrently.
+
+    Decompression releases the GIL, so decoding one file overlaps with
+    reading the other.
+
+    Returns:
+        tuple: ((link schema, link table), (speed schema, speed table))
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        link_future = executor.submit(
+            load_projected_table, LINK_INFO_PATH, LINK_COLUMNS
+        )
+        speed_future = executor.submit(
+            load_projected_table, SPEED_DATA_PATH, SPEED_COLUMNS
+        )
+        return link_future.result(), speed_future.result()
+
+
+def print_schema(schema):
+    """Print column names and types from the Parquet footer."""
+    print(f"Columns: {schema.names}")
+    print("Data types:")
+    for field in schema:
+        print(f"  {field.name:<25} {field.type}")
+
+
+def print_missing_values(table):
+    """Print null counts for every column of an Arrow table."""
+    print(f"\nMissing values:")
+    for name, column in zip(table.column_names, table.columns):
+        print(f"  {name:<25} {column.null_count}")
+
+
+def print_distinct_counts(table):
+    """Print the number of distinct values in each string column."""
+    string_columns = [
+        field.name for field in table.schema if pa.types.is_string(field.type)
+    ]
+    if not string_columns:
+        return
+    print(f"\nDistinct values:")
+    for name in string_columns:
+        print(f"  {name:<25} {pc.count_distinct(table[name]).as_py():,}")
+
+
+def describe_numeric(column: pa.ChunkedArray):
+    """Print describe()-style statistics computed with pyarrow.compute."""
+    min_max = pc.min_max(column)
+    quartiles = pc.quantile(column, q=[0.25, 0.5, 0.75]).to_pylist()
+    stats = [
+        ("count", pc.count(column).as_py()),
+        ("mean", pc.mean(column).as_py()),
+        ("std", pc.stddev(column, ddof=1).as_py()),
+        ("min", min_max["min"].as_py()),
+        ("25%", quartiles[0]),
+        ("50%", quartiles[1]),
+        ("75%", quartiles[2]),
+        ("max", min_max["max"].as_py()),
+    ]
+    for label, value in stats:
+        print(f"  {label:<6} {value:,.6f}")
+
+
+def unique_link_ids(table) -> pa.Array:
+    """Return the distinct link_id values of a table (empty if the column is absent)."""
+    if "link_id" not in table.column_names:
+        return pa.array([], type=pa.int64())
+    return pc.unique(table["link_id"])
+
+
+def analyze_link_data(schema, link_table):
+    """
+    Analyze the link_info.parquet.gz dataset.
+
+    Returns:
+        pa.Array: Distinct link_id values, reused by the compatibility check
+    """
     print("=" * 80)
     print(" ANALYZING LINK INFO DATASET")
     print("=" * 80)
 
-    # Load the dataset
-    link_df = pd.read_parquet("/workspace/data/raw/link_info.parquet.gz")
-
-    print(f"Total links: {len(link_df):,}")
-    print(f"Columns: {list(link_df.columns)}")
-    print(f"Data types:\n{link_df.dtypes}")
+    print(f"Total links: {link_table.num_rows:,}")
+    print_schema(schema)
 
     # Examine sample data
     print("\nSample rows:")
-    print(link_df.head())
+    print(link_table.slice(0, 5).to_pandas())
 
     # Check for missing values
-    print(f"\nMissing values:")
-    print(link_df.isnull().sum())
+    print_missing_values(link_table)
+    print_distinct_counts(link_table)
 
     # Analyze geo_json column specifically
     print("\nGeo_json analysis:")
-    if "geo_json" in link_df.columns:
-        sample_geo = link_df["geo_json"].iloc[0]
+    if "geo_json" in link_table.column_names:
+        sample_geo = link_table["geo_json"][0].as_py()
         print(f"Sample geo_json type: {type(sample_geo)}")
         print(f"Sample geo_json content (first 200 chars): {str(sample_geo)[:200]}")
 
@@ -59,70 +159,74 @@ def analyze_link_data():
         except Exception as e:
             print(f"Error parsing geo_json: {e}")
 
-    return link_df
+    link_ids = unique_link_ids(link_table)
+    print(f"\nUnique links in link data: {len(link_ids):,}")
+    return link_ids
+
 
+def analyze_speed_data(schema, speed_table):
+    """
+    Analyze the duval_jan1_2024.parquet.gz dataset.
 
-def analyze_speed_data():
-    """Analyze the duval_jan1_2024.parquet.gz dataset."""
+    Returns:
+        pa.Array: Distinct link_id values, reused by the compatibility check
+    """
     print("\n" + "=" * 80)
     print(" ANALYZING SPEED DATASET")
     print("=" * 80)
 
-    # Load the dataset
-    speed_df = pd.read_parquet("/workspace/data/raw/duval_jan1_2024.parquet.gz")
-
-    print(f"Total speed records: {len(speed_df):,}")
-    print(f"Columns: {list(speed_df.columns)}")
-    print(f"Data types:\n{speed_df.dtypes}")
+    print(f"Total speed records: {speed_table.num_rows:,}")
+    print_schema(schema)
 
     # Examine sample data
     print("\nSample rows:")
-    print(speed_df.head())
+    print(speed_table.slice(0, 5).to_pandas())
 
     # Check for missing values
-    print(f"\nMissing values:")
-    print(speed_df.isnull().sum())
+    print_missing_values(speed_table)
+    print_distinct_counts(speed_table)
 
     # Analyze key columns
-    if "period" in speed_df.columns:
-        print(f"\nPeriod values: {sorted(speed_df['period'].unique())}")
+    if "period" in speed_table.column_names:
+        periods = pc.unique(speed_table["period"]).drop_null().to_pylist()
+        print(f"\nPeriod values: {sorted(periods)}")
 
-    if "average_speed" in speed_df.columns:
+    if "average_speed" in speed_table.column_names:
         print(f"\nSpeed statistics:")
-        print(speed_df["average_speed"].describe())
+        describe_numeric(speed_table["average_speed"])
 
-    if "link_id" in speed_df.columns:
-        print(f"\nUnique links in speed data: {speed_df['link_id'].nunique():,}")
+    link_ids = unique_link_ids(speed_table)
+    print(f"\nUnique links in speed data: {len(link_ids):,}")
 
-    if "date_time" in speed_df.columns:
-        print(
-            f"\nDate range: {speed_df['date_time'].min()} to {speed_df['date_time'].max()}"
-        )
+    if "date_time" in speed_table.column_names:
+        date_range = pc.min_max(speed_table["date_time"])
+        print(f"\nDate range: {date_range['min']} to {date_range['max']}")
+
+    return link_ids
 
-    return speed_df
 
+def check_data_compatibility(link_ids_in_links, link_ids_in_speed):
+    """
+    Check compatibility between datasets.
 
-def check_data_compatibility(link_df, speed_df):
-    """Check compatibility between datasets."""
+    Args:
+        link_ids_in_links: Distinct link_id values from link_info
+        link_ids_in_speed: Distinct link_id values from the speed data
+    """
     print("\n" + "=" * 80)
     print(" CHECKING DATA COMPATIBILITY")
     print("=" * 80)
 
-    # Check link_id overlap
-    link_ids_in_links = (
-        set(link_df["link_id"].unique()) if "link_id" in link_df.columns else set()
-    )
-    link_ids_in_speed = (
-        set(speed_df["link_id"].unique()) if "link_id" in speed_df.columns else set()
+    # Check link_id overlap: one hash table on link_info ids, probed once
+    common_count = (
+        pc.sum(pc.is_in(link_ids_in_speed, value_set=link_ids_in_links)).as_py() or 0
     )
 
     print(f"Unique link_ids in link_info: {len(link_ids_in_links):,}")
     print(f"Unique link_ids in speed_data: {len(link_ids_in_speed):,}")
-    print(f"Common link_ids: {len(link_ids_in_links & link_ids_in_speed):,}")
-    print(f"Link_ids only in link_info: {len(link_ids_in_links - link_ids_in_speed):,}")
-    print(
-        f"Link_ids only in speed_data: {len(link_ids_in_speed - link_ids_in_links):,}"
-    )
+    print(f"Common link_ids: {common_count:,}")
+    print(f"Link_ids only in link_info: {len(link_ids_in_links) - common_count:,}")
+    print(f"Link_ids only in speed_data: {len(link_ids_in_speed) - common_count:,}")
 
 
 def main():
@@ -131,12 +235,14 @@ def main():
     print("Analyzing Parquet datasets before ingestion...")
 
     try:
-        # Analyze both datasets
-        link_df = analyze_link_data()
-        speed_df = analyze_speed_data()
-
-        # Check compatibility
-        check_data_compatibility(link_df, speed_df)
+        # Load both datasets in parallel, then analyze them
+        link_data, speed_data = prefetch_tables()
+        link_ids = analyze_link_data(*link_data)
+        speed_link_ids = analyze_speed_data(*speed_data)
+
+        # Check compatibility on the distinct ids; the tables are no longer needed
+        del link_data, speed_data
+        check_data_compatibility(link_ids, speed_link_ids)
 
         print("\n" + "=" * 80)
         print(" ANALYSIS COMPLETED")
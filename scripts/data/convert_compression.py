@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Re-encode the raw gzip Parquet files with zstd.
+
+Gzip pages are decompressed on a single thread and several times slower
+than zstd at a similar ratio. This one-time conversion writes a
+.parquet.zst copy next to each .parquet.gz file; the analysis scripts
+read the zstd copy whenever it exists.
+"""
+
+import sys
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+RAW_DATA_DIR = Path("/workspace/data/raw")
+SOURCE_FILES = ["link_info.parquet.gz", "duval_jan1_2024.parquet.gz"]
+
+ZSTD_LEVEL = 3
+DATA_PAGE_SIZE = 1 << 20  # 1 MiB
+ROW_GROUP_SIZE = 256_000
+
+
+def zstd_path(path):
+    """Return the .parquet.zst path that corresponds to a .parquet.gz file."""
+    path = Path(path)
+    return path.with_name(path.name.removesuffix(".gz") + ".zst")
+
+
+def prefer_zstd(path):
+    """
+    Return the zstd copy of a Parquet file if it has been generated.
+
+    Args:
+        path: Path to the original .parquet.gz file
+
+    Returns:
+        str: Path of the file to read
+    """
+    converted = zstd_path(path)
+    return str(converted) if converted.exists() else str(path)
+
+
+def convert_to_zstd(source):
+    """
+    Rewrite a Parquet file with zstd compression.
+
+    Dictionary encoding is kept on, which shrinks the low-cardinality
+    columns (road names, period, day_of_week) further.
+
+    Args:
+        source: Path to the .parquet.gz file
+
+    Returns:
+        Path: Path of the written .parquet.zst file
+    """
+    destination = zstd_path(source)
+    table = pq.read_table(source)
+    pq.write_table(
+        table,
+        destination,
+        compression="zstd",
+        compression_level=ZSTD_LEVEL,
+        use_dictionary=True,
+        data_page_size=DATA_PAGE_SIZE,
+        row_group_size=ROW_GROUP_SIZE,
+    )
+    return destination
+
+
+def main():
+    """Convert every raw dataset to zstd."""
+    print("Converting raw Parquet files to zstd...")
+
+    for name in SOURCE_FILES:
+        source = RAW_DATA_DIR / name
+        if not source.exists():
+            print(f"ERROR: {source} not found!")
+            return False
+
+        destination = convert_to_zstd(source)
+        source_mb = source.stat().st_size / 1024**2
+        destination_mb = destination.stat().st_size / 1024**2
+        print(f"  {source.name} ({source_mb:.1f} MB)")
+        print(f"    -> {destination.name} ({destination_mb:.1f} MB)")
+
+    print("Conversion complete")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -6,84 +6,243 @@ This script examines the datasets to understand their schema and content
 before implementing the full ingestion process.
 """
 
+import math
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from convert_compression import prefer_zstd
 
 # Add project root to Python path
 sys.path.insert(0, "/workspace")
 
+# Rows decoded at a time; peak memory is bounded by one batch
+STREAM_BATCH_SIZE = 65_536
+
+# Categorical columns with fewer distinct values than this have them listed
+MAX_DISPLAY_UNIQUES = 20
+
+
+def column_group(arrow_type):
+    """
+    Map an Arrow type to the analysis it receives.
+
+    Decimals are grouped with strings, matching the object dtype pandas
+    gives them.
+
+    Returns:
+        str or None: "categorical", "numeric", "datetime" or None
+    """
+    if pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type):
+        return "numeric"
+    if pa.types.is_timestamp(arrow_type) or pa.types.is_date(arrow_type):
+        return "datetime"
+    if (
+        pa.types.is_string(arrow_type)
+        or pa.types.is_large_string(arrow_type)
+        or pa.types.is_dictionary(arrow_type)
+        or pa.types.is_decimal(arrow_type)
+    ):
+        return "categorical"
+    return None
+
+
+def update_numeric_stats(stats, column):
+    """
+    Merge one batch into running (count, mean, m2, min, max) statistics.
+
+    Uses the pairwise update of Chan et al., which stays accurate for large
+    values where a running sum of squares would lose float64 precision.
+    """
+    count = len(column) - column.null_count
+    if count == 0:
+        return
+    values = pc.cast(column, pa.float64())
+    mean = pc.mean(values).as_py()
+    m2 = pc.variance(values, ddof=0).as_py() * count
+    min_max = pc.min_max(values)
+
+    total = stats["count"] + count
+    delta = mean - stats["mean"]
+    stats["mean"] += delta * count / total
+    stats["m2"] += m2 + delta * delta * stats["count"] * count / total
+    stats["count"] = total
+    stats["min"] = min(stats["min"], min_max["min"].as_py())
+    stats["max"] = max(stats["max"], min_max["max"].as_py())
+
+
+def summarize_numeric(stats):
+    """Build a describe()-style frame from the merged numeric statistics."""
+    summary = {}
+    for col, col_stats in stats.items():
+        count = col_stats["count"]
+        summary[col] = {
+            "count": count,
+            "mean": col_stats["mean"] if count else math.nan,
+            "std": math.sqrt(col_stats["m2"] / (count - 1)) if count > 1 else math.nan,
+            "min": col_stats["min"] if count else math.nan,
+            "max": col_stats["max"] if count else math.nan,
+        }
+    return pd.DataFrame(summary)
+
+
+def update_distinct_values(distinct, column):
+    """
+    Track distinct values until there are too many to display.
+
+    Returns:
+        set or None: Updated distinct values, or None once the limit is passed
+    """
+    if distinct is None:
+        return None
+    uniques = pc.unique(column.drop_null())
+    if len(uniques) >= MAX_DISPLAY_UNIQUES:
+        return None
+    distinct.update(uniques.to_pylist())
+    return distinct if len(distinct) < MAX_DISPLAY_UNIQUES else None
+
 
 def explore_dataset(file_path, dataset_name):
-    """Explore a single dataset and print its structure."""
+    """
+    Explore a single dataset and print its structure.
+
+    The file is streamed in batches of STREAM_BATCH_SIZE rows, so only one
+    batch is held in memory while the statistics are accumulated.
+
+    Returns:
+        pyarrow.Schema or None: File schema, or None if the file could not be read
+    """
     print(f"\n{'='*60}")
     print(f"EXPLORING {dataset_name.upper()}")
     print(f"File: {file_path}")
     print(f"{'='*60}")
 
     try:
-        # Read the dataset
+        # Row counts, schema and sizes come from the Parquet footer
         print("Reading dataset...")
-        df = pd.read_parquet(file_path)
+        parquet_file = pq.ParquetFile(file_path)
+        schema = parquet_file.schema_arrow
+        metadata = parquet_file.metadata
+        total_rows = metadata.num_rows
+        uncompressed_bytes = sum(
+            metadata.row_group(i).total_byte_size
+            for i in range(metadata.num_row_groups)
+        )
 
         # Basic info
         print(f"\nDATASET INFO:")
-        print(f"  Rows: {len(df):,}")
-        print(f"  Columns: {len(df.columns)}")
-        print(f"  Memory usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+        print(f"  Rows: {total_rows:,}")
+        print(f"  Columns: {len(schema)}")
+        print(f"  Uncompressed size: {uncompressed_bytes / 1024**2:.2f} MB")
+
+        groups = {field.name: column_group(field.type) for field in schema}
+        null_counts = dict.fromkeys(schema.names, 0)
+        numeric_stats = {
+            name: {
+                "count": 0,
+                "mean": 0.0,
+                "m2": 0.0,
+                "min": math.inf,
+                "max": -math.inf,
+            }
+            for name, group in groups.items()
+            if group == "numeric"
+        }
+        distinct_values = {
+            name: set() for name, group in groups.items() if group == "categorical"
+        }
+        datetime_ranges = {}
+        sample_rows = None
+
+        for batch in parquet_file.iter_batches(batch_size=STREAM_BATCH_SIZE):
+            if sample_rows is None:
+                sample_rows = batch.slice(0, 3).to_pandas()
+
+            for name, column in zip(batch.schema.names, batch.columns):
+                null_counts[name] += column.null_count
+                group = groups[name]
+                if group == "numeric":
+                    update_numeric_stats(numeric_stats[name], column)
+                elif group == "categorical":
+                    distinct_values[name] = update_distinct_values(
+                        distinct_values[name], column
+                    )
+                elif group == "datetime" and len(column) > column.null_count:
+                    min_max = pc.min_max(column)
+                    low, high = min_max["min"].as_py(), min_max["max"].as_py()
+                    if name in datetime_ranges:
+                        prev_low, prev_high = datetime_ranges[name]
+                        low, high = min(low, prev_low), max(high, prev_high)
+                    datetime_ranges[name] = (low, high)
 
         # Column info
         print(f"\nCOLUMNS:")
-        for i, col in enumerate(df.columns, 1):
-            dtype = df[col].dtype
-            null_count = df[col].isnull().sum()
-            null_pct = (null_count / len(df)) * 100
+        for i, field in enumerate(schema, 1):
+            null_count = null_counts[field.name]
+            null_pct = (null_count / total_rows) * 100 if total_rows else 0.0
             print(
-                f"  {i:2d}. {col:<25} | {str(dtype):<15} | {null_count:>6} nulls ({null_pct:5.1f}%)"
+                f"  {i:2d}. {field.name:<25} | {str(field.type):<15} | {null_count:>6} nulls ({null_pct:5.1f}%)"
             )
 
         # Sample data
         print(f"\nSAMPLE DATA (first 3 rows):")
-        print(df.head(3).to_string())
+        if sample_rows is not None:
+            print(sample_rows.to_string())
 
         # Unique values for categorical columns
         print(f"\nCATEGORICAL ANALYSIS:")
-        for col in df.columns:
-            if df[col].dtype == "object" or df[col].dtype == "category":
-                unique_count = df[col].nunique()
-                if unique_count < 20:  # Show unique values if reasonable count
-                    unique_vals = sorted(df[col].dropna().unique())
-                    print(f"  {col}: {unique_count} unique values")
-                    print(f"    Values: {unique_vals}")
-                else:
-                    print(
-                        f"  {col}: {unique_count} unique values (too many to display)"
-                    )
+        for col, distinct in distinct_values.items():
+            if distinct is not None:  # Show unique values if reasonable count
+                print(f"  {col}: {len(distinct)} unique values")
+                print(f"    Values: {sorted(distinct)}")
+            else:
+                print(
+                    f"  {col}: {MAX_DISPLAY_UNIQUES}+ unique values (too many to display)"
+                )
 
         # Numeric analysis
         print(f"\nNUMERIC ANALYSIS:")
-        numeric_cols = df.select_dtypes(include=["number"]).columns
-        if len(numeric_cols) > 0:
-            print(df[numeric_cols].describe())
+        if numeric_stats:
+            print(summarize_numeric(numeric_stats))
 
         # Datetime analysis
-        datetime_cols = df.select_dtypes(include=["datetime64"]).columns
-        if len(datetime_cols) > 0:
+        if datetime_ranges:
             print(f"\nDATETIME ANALYSIS:")
-            for col in datetime_cols:
-                min_date = df[col].min()
-                max_date = df[col].max()
+            for col, (min_date, max_date) in datetime_ranges.items():
                 print(f"  {col}: {min_date} to {max_date}")
 
-        return df
+        return schema
 
     except Exception as e:
         print(f"ERROR reading {dataset_name}: {e}")
         return None
 
 
+def read_unique_link_ids(file_path):
+    """Read only the link_id column of a file and return its distinct values."""
+    table = pq.read_table(
+        file_path, columns=["link_id"], pre_buffer=True, use_threads=True
+    )
+    return pc.unique(table["link_id"])
+
+
+def first_non_null(file_path, column):
+    """Return the first non-null value of a column, reading it batch by batch."""
+    parquet_file = pq.ParquetFile(file_path)
+    for batch in parquet_file.iter_batches(
+        batch_size=STREAM_BATCH_SIZE, columns=[column]
+    ):
+        values = batch.column(0).drop_null()
+        if len(values) > 0:
+            return values[0].as_py()
+    return None
+
+
 def main():
     """Main exploration function."""
     print("GeoSpatial Links API - Dataset Exploration")
@@ -91,8 +250,8 @@ def main():
 
     # Check if files exist
     raw_dir = Path("/workspace/data/raw")
-    link_info_file = raw_dir / "link_info.parquet.gz"
-    speed_data_file = raw_dir / "duval_jan1_2024.parquet.gz"
+    link_info_file = Path(prefer_zstd(raw_dir / "link_info.parquet.gz"))
+    speed_data_file = Path(prefer_zstd(raw_dir / "duval_jan1_2024.parquet.gz"))
 
     if not link_info_file.exists():
         print(f"ERROR: {link_info_file} not found!")
@@ -106,32 +265,38 @@ def main():
     print("Found both datasets, starting exploration...")
 
     # Explore Link Info dataset
-    link_df = explore_dataset(link_info_file, "Link Info Dataset")
+    link_schema = explore_dataset(link_info_file, "Link Info Dataset")
 
     # Explore Speed Data dataset
-    speed_df = explore_dataset(speed_data_file, "Speed Data Dataset")
+    speed_schema = explore_dataset(speed_data_file, "Speed Data Dataset")
 
     # Cross-analysis if both loaded successfully
-    if link_df is not None and speed_df is not None:
+    if link_schema is not None and speed_schema is not None:
         print(f"\n{'='*60}")
         print("CROSS-DATASET ANALYSIS")
         print(f"{'='*60}")
 
         # Check for common link_ids
-        if "link_id" in link_df.columns and "link_id" in speed_df.columns:
-            link_ids_info = set(link_df["link_id"].unique())
-            link_ids_speed = set(speed_df["link_id"].unique())
+        if "link_id" in link_schema.names and "link_id" in speed_schema.names:
+            # Only the link_id column is decoded, from both files at once
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                link_ids_info, link_ids_speed = executor.map(
+                    read_unique_link_ids, [link_info_file, speed_data_file]
+                )
+            common_count = (
+                pc.sum(pc.is_in(link_ids_speed, value_set=link_ids_info)).as_py() or 0
+            )
 
             print(f"Link IDs in Link Info: {len(link_ids_info):,}")
             print(f"Link IDs in Speed Data: {len(link_ids_speed):,}")
-            print(f"Common Link IDs: {len(link_ids_info & link_ids_speed):,}")
-            print(f"Link Info only: {len(link_ids_info - link_ids_speed):,}")
-            print(f"Speed Data only: {len(link_ids_speed - link_ids_info):,}")
+            print(f"Common Link IDs: {common_count:,}")
+            print(f"Link Info only: {len(link_ids_info) - common_count:,}")
+            print(f"Speed Data only: {len(link_ids_speed) - common_count:,}")
 
         # Check for geometry columns
         geometry_cols = [
             col
-            for col in link_df.columns
+            for col in link_schema.names
             if "geometry" in col.lower()
             or "geom" in col.lower()
             or "wkt" in col.lower()
@@ -139,11 +304,7 @@ def main():
         if geometry_cols:
             print(f"\nGeometry columns found: {geometry_cols}")
             for col in geometry_cols:
-                sample_geom = (
-                    link_df[col].dropna().iloc[0]
-                    if not link_df[col].dropna().empty
-                    else None
-                )
+                sample_geom = first_non_null(link_info_file, col)
                 if sample_geom:
                     print(f"  {col} sample: {str(sample_geom)[:100]}...")
 
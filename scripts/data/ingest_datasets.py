@@ -7,38 +7,164 @@ This script ingests the Parquet datasets into PostgreSQL/PostGIS database:
 - Speed Data: Traffic speed measurements
 
 PERFORMANCE OPTIMIZED VERSION:
-- Chunk Processing: 5K records per chunk to reduce memory consumption
-- Streaming Pipeline: Sequential processing with memory cleanup
-- Bulk Operations: SQLAlchemy bulk_save_objects for optimal performance
+- Chunk Processing: 5K links / 10K speed records per chunk to bound memory
+- Streaming Pipeline: The next chunk is read while the current one is copied
+- Bulk Operations: PostgreSQL COPY FROM STDIN, one statement per chunk
 
 Clean Code principles: SOLID, KISS, separation of concerns.
 Designed for Docker container with all dependencies available.
 """
 
-import gc
-import json
+import io
 import os
+import queue
+import struct
 import sys
-from typing import List, Set
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, List, Tuple
 
+import numpy as np
 import pandas as pd
-from geoalchemy2 import WKTElement
-from shapely.geometry import shape
-from sqlalchemy import func, text
+import pyarrow as pa
+import pyarrow.parquet as pq
+import shapely
+from convert_compression import prefer_zstd
+from sqlalchemy import Table, func, text
 from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex, DropIndex
 
 # Add project root to Python path
 sys.path.insert(0, "/workspace")
 
-from app.core.database import get_session_factory
+from app.core.database import get_engine, get_session_factory
 from app.models.link import Link
 from app.models.speed_record import SpeedRecord
 
 # Configuration constants
 LINK_CHUNK_SIZE = 5000
-SPEED_RECORD_CHUNK_SIZE = 5000
-LINK_BATCH_SIZE = 1000
-SPEED_BATCH_SIZE = 2000
+# One COPY and one commit per chunk; larger chunks amortize the commit fsync
+SPEED_RECORD_CHUNK_SIZE = 10000
+
+# Running totals are printed every this many chunks, and after the last
+PROGRESS_INTERVAL = 20
+
+# Chunks that fail to COPY are saved here instead of retried row by row
+REJECT_DIR = "/workspace/data/rejects"
+
+# Transformed chunks allowed to wait for the database at once
+PIPELINE_DEPTH = 2
+
+# Only these Parquet columns are decoded during ingestion
+LINK_COLUMNS = ["link_id", "road_name", "_length", "geo_json"]
+SPEED_RECORD_COLUMNS = ["link_id", "date_time", "average_speed", "period"]
+
+# Row layouts written by the transforms and loaded with COPY
+LinkRow = Tuple[int, str | None, float | None, bytes]
+# Transformed speed record columns: link IDs, naive UTC timestamps, speeds
+# and SPEED_RECORD_TAILS codes, kept for the reject file if the COPY fails
+SpeedRecordColumns = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+# COPY BINARY payload for a speed record chunk and the columns it encodes
+SpeedRecordCopy = Tuple[bytes, SpeedRecordColumns]
+
+# Links are copied straight into the table; the geometry column's binary
+# input function reads EWKB without a WKT parse
+LINK_COPY = (
+    "COPY links (link_id, road_name, length, geometry) "
+    "FROM STDIN WITH (FORMAT binary)"
+)
+# Speed records are staged too; the join against links replaces a
+# client-side set of valid link IDs for referential integrity
+SPEED_RECORD_STAGING_DDL = """
+    CREATE TEMP TABLE speed_records_staging (
+        link_id integer,
+        timestamp timestamp,
+        speed double precision,
+        day_of_week text,
+        time_period text
+    ) ON COMMIT DROP
+"""
+SPEED_RECORD_STAGING_COPY = (
+    "COPY speed_records_staging "
+    "(link_id, timestamp, speed, day_of_week, time_period) "
+    "FROM STDIN WITH (FORMAT binary)"
+)
+
+# Bytes handed to psycopg2 per read of a COPY payload (its default is 8 KiB)
+COPY_BUFFER_SIZE = 1 << 20
+
+# PostgreSQL COPY BINARY framing: signature, flags, header extension length
+PG_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+PG_COPY_TRAILER = struct.pack(">h", -1)
+PG_COPY_NULL = struct.pack(">i", -1)
+# Binary timestamps count microseconds from the PostgreSQL epoch
+PG_EPOCH = np.datetime64("2000-01-01T00:00:00", "us")
+
+# Binary link rows: field count and link_id, then the nullable fields
+LINK_BINARY_HEAD = struct.Struct(">hii")
+FLOAT8_FIELD = struct.Struct(">id")
+
+# Fixed-width head of a binary speed record row; every value is preceded by
+# its byte length. day_of_week and time_period follow as text.
+SPEED_RECORD_BINARY_HEAD = np.dtype(
+    [
+        ("field_count", ">i2"),
+        ("link_id_size", ">i4"),
+        ("link_id", ">i4"),
+        ("timestamp_size", ">i4"),
+        ("timestamp", ">i8"),
+        ("speed_size", ">i4"),
+        ("speed", ">f8"),
+    ]
+)
+SPEED_RECORD_STAGING_INSERT = """
+    INSERT INTO speed_records (link_id, timestamp, speed, day_of_week, time_period)
+    SELECT s.link_id, s.timestamp, s.speed, s.day_of_week, s.time_period
+    FROM speed_records_staging s
+    JOIN links l ON l.link_id = s.link_id
+"""
+
+# Default PostgreSQL name of the speed_records.link_id foreign key
+SPEED_RECORD_LINK_FK = "speed_records_link_id_fkey"
+SPEED_RECORD_FK_DROP = (
+    f"ALTER TABLE speed_records DROP CONSTRAINT IF EXISTS {SPEED_RECORD_LINK_FK}"
+)
+SPEED_RECORD_FK_ADD = f"""
+    ALTER TABLE speed_records ADD CONSTRAINT {SPEED_RECORD_LINK_FK}
+    FOREIGN KEY (link_id) REFERENCES links (link_id) ON DELETE CASCADE NOT VALID
+"""
+SPEED_RECORD_FK_VALIDATE = (
+    f"ALTER TABLE speed_records VALIDATE CONSTRAINT {SPEED_RECORD_LINK_FK}"
+)
+
+# Resets the speed_records id sequence as well
+TRUNCATE_TABLES = "TRUNCATE TABLE speed_records, links RESTART IDENTITY CASCADE"
+
+# Session settings for the load. The run is a reproducible rebuild, so a
+# crash losing the last commits is acceptable; commits skip the WAL flush
+LOAD_SESSION_SETTINGS = [
+    "SET synchronous_commit = off",
+    "SET work_mem = '256MB'",
+]
+
+# Memory for the index rebuilds after the load (GiST builds benefit most)
+INDEX_BUILD_MEMORY = "SET LOCAL maintenance_work_mem = '512MB'"
+
+# Tables switched to UNLOGGED during the load, in a safe order for the
+# foreign key: an unlogged table may reference a logged one, not vice versa
+UNLOGGED_LOAD_TABLES = ["speed_records", "links"]
+
+# SRID of the links geometry column, embedded in the EWKB
+GEOMETRY_SRID = 4326
+
+# shapely.get_type_id codes for LineString and MultiLineString
+LINESTRING_TYPE_ID = 1
+MULTILINESTRING_TYPE_ID = 5
+
+# GEOS releases the GIL, so geometry conversion scales across threads
+GEOMETRY_WORKERS = os.cpu_count() or 1
+GEOMETRY_EXECUTOR = ThreadPoolExecutor(max_workers=GEOMETRY_WORKERS)
 
 PERIOD_MAPPING = {
     1: "Overnight",
@@ -50,6 +176,43 @@ PERIOD_MAPPING = {
     7: "Evening",
 }
 
+# Day names in pandas dayofweek order (Monday == 0)
+DAY_NAMES = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+
+# Period names indexed by period code; code 0 stands for a missing or
+# unknown period, so lookups are a bounds check instead of a dict probe
+PERIOD_LUT = (None, *(PERIOD_MAPPING[period] for period in range(1, 8)))
+PERIOD_CODES = len(PERIOD_LUT)
+
+
+def _binary_text_field(value: str | None) -> bytes:
+    """Encode a text value as a COPY BINARY field (-1 length for NULL)."""
+    if value is None:
+        return PG_COPY_NULL
+    data = value.encode("utf-8")
+    return struct.pack(">i", len(data)) + data
+
+
+# Encoded (day_of_week, time_period) tail of a binary speed record row,
+# indexed by day * PERIOD_CODES + period
+SPEED_RECORD_TAILS = [
+    np.frombuffer(
+        _binary_text_field(day) + _binary_text_field(PERIOD_LUT[period]),
+        dtype=np.uint8,
+    )
+    for day in DAY_NAMES
+    for period in range(PERIOD_CODES)
+]
+SPEED_RECORD_TAIL_SIZES = np.array([len(tail) for tail in SPEED_RECORD_TAILS])
+
 
 def main():
     """Main ingestion function with optimized chunk processing."""
@@ -57,21 +220,33 @@ def main():
     print("Ingesting Parquet datasets using chunked processing for memory efficiency")
 
     try:
+        # Fail on a missing file or column before the tables are cleared
+        check_datasets()
+
         # Create session for database operations
         Session = get_session_factory()
 
-        with Session() as session:
-            # Clear existing data
-            clear_existing_data_orm(session)
+        # The factory already disables autoflush; nothing loaded here needs
+        # refreshing, so skip expiring the identity map on every commit.
+        # The session is pinned to one connection so that the settings
+        # from configure_load_session apply to every phase.
+        with get_engine().connect() as connection, Session(
+            bind=connection, expire_on_commit=False
+        ) as session:
+            configure_load_session(session)
 
-            # Process links in chunks (memory efficient)
-            process_links_chunked(session)
+            # Clear existing data first, so SET UNLOGGED rewrites empty tables
+            clear_existing_data_orm(session)
 
-            # Get existing link IDs for referential integrity
-            existing_link_ids = get_existing_link_ids(session)
+            # Skip WAL writes while the tables are rebuilt
+            with unlogged_tables(session):
+                # Process links in chunks (memory efficient)
+                with deferred_indexes(session, Link.__table__):
+                    process_links_chunked(session)
 
-            # Process speed records in chunks (memory efficient)
-            process_speed_records_chunked(session, existing_link_ids)
+                # Process speed records in chunks (memory efficient)
+                with deferred_speed_record_indexes(session):
+                    process_speed_records_chunked(session)
 
             # Verify results
             verify_data_orm(session)
@@ -100,83 +275,138 @@ def print_step(step, description):
     print("-" * 60)
 
 
-def load_datasets():
-    """Load both Parquet datasets."""
-    print_step(1, "LOADING DATASETS")
+def check_datasets() -> Tuple[int, int]:
+    """
+    Check both Parquet datasets from their footers, before any data is cleared.
 
-    # Load Link Info Dataset
-    print("Loading link_info.parquet.gz...")
-    link_info_path = "/workspace/data/raw/link_info.parquet.gz"
-    if not os.path.exists(link_info_path):
-        raise FileNotFoundError(f"Link info dataset not found: {link_info_path}")
+    Only the file metadata is read: row counts and column names come from
+    the footer, so no column data is decoded.
 
-    link_df = pd.read_parquet(link_info_path)
-    print(f"  Links loaded: {len(link_df):,}")
-    print(f"  Columns: {list(link_df.columns)}")
+    Returns:
+        tuple: (number of links, number of speed records)
+    """
+    print("Checking datasets...")
+    datasets = [
+        ("/workspace/data/raw/link_info.parquet.gz", LINK_COLUMNS),
+        ("/workspace/data/raw/duval_jan1_2024.parquet.gz", SPEED_RECORD_COLUMNS),
+    ]
 
-    # Load Speed Data Dataset
-    print("\nLoading duval_jan1_2024.parquet.gz...")
-    speed_data_path = "/workspace/data/raw/duval_jan1_2024.parquet.gz"
-    if not os.path.exists(speed_data_path):
-        raise FileNotFoundError(f"Speed data dataset not found: {speed_data_path}")
+    row_counts = []
+    for raw_path, columns in datasets:
+        path = prefer_zstd(raw_path)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Dataset not found: {path}")
 
-    speed_df = pd.read_parquet(speed_data_path)
-    print(f"  Speed records loaded: {len(speed_df):,}")
-    print(f"  Columns: {list(speed_df.columns)}")
+        parquet_file = pq.ParquetFile(path)
+        missing = set(columns) - set(parquet_file.schema_arrow.names)
+        if missing:
+            raise ValueError(f"{path} is missing columns: {sorted(missing)}")
 
-    return link_df, speed_df
+        row_counts.append(parquet_file.metadata.num_rows)
+        print(f"  {os.path.basename(path)}: {row_counts[-1]:,} rows")
 
+    return row_counts[0], row_counts[1]
 
-def convert_geometry_to_wkt_element(geo_json_str):
-    """Convert GeoJSON string to WKTElement for PostGIS via GeoAlchemy2."""
-    try:
-        # Parse JSON string
-        geo_json = (
-            json.loads(geo_json_str) if isinstance(geo_json_str, str) else geo_json_str
-        )
 
-        # Convert to Shapely geometry
-        geom = shape(geo_json)
+def _batch_to_pandas(batch) -> pd.DataFrame:
+    """Convert a RecordBatch, releasing its Arrow buffers as columns convert."""
+    return batch.to_pandas(self_destruct=True, split_blocks=True)
 
-        # Convert MultiLineString to LineString (take first linestring)
-        if geom.geom_type == "MultiLineString":
-            try:
-                # Cast to MultiLineString and access first geometry
-                from shapely.geometry import MultiLineString
 
-                if isinstance(geom, MultiLineString) and len(geom.geoms) > 0:
-                    geom = geom.geoms[0]
-                else:
-                    return None
-            except (IndexError, AttributeError):
-                return None
+def convert_geometries_to_ewkb(geo_json_values: np.ndarray) -> np.ndarray:
+    """
+    Convert GeoJSON strings to EWKB, one slice per CPU core.
+
+    Each slice is converted with vectorized shapely calls on
+    GEOMETRY_EXECUTOR; GEOS runs without the GIL, so slices proceed in
+    parallel. MultiLineStrings are reduced to their first LineString to
+    match the LINESTRING column.
 
-        # Return as WKTElement with SRID for GeoAlchemy2
-        return WKTElement(geom.wkt, srid=4326)
+    Args:
+        geo_json_values: Object array of GeoJSON strings (None for missing)
+
+    Returns:
+        np.ndarray: EWKB bytes, or None where the geometry could not be parsed
+    """
+    if GEOMETRY_WORKERS == 1:
+        return _geojson_to_ewkb(geo_json_values)
+
+    slices = np.array_split(geo_json_values, GEOMETRY_WORKERS)
+    return np.concatenate(list(GEOMETRY_EXECUTOR.map(_geojson_to_ewkb, slices)))
 
-    except Exception as e:
-        print(f"Error converting geometry: {e}")
-        return None
 
+def _geojson_to_ewkb(geo_json_values: np.ndarray) -> np.ndarray:
+    """Convert one array of GeoJSON strings to LineString EWKB in GEOS."""
+    geometries = shapely.from_geojson(geo_json_values, on_invalid="ignore")
 
-def _safe_float_conversion(value) -> float | None:
+    multi_mask = shapely.get_type_id(geometries) == MULTILINESTRING_TYPE_ID
+    geometries[multi_mask] = shapely.get_geometry(geometries[multi_mask], 0)
+
+    # Other types would fail the whole chunk's COPY into the LINESTRING column
+    geometries[shapely.get_type_id(geometries) != LINESTRING_TYPE_ID] = None
+
+    geometries = shapely.set_srid(geometries, GEOMETRY_SRID)
+    return shapely.to_wkb(geometries, include_srid=True)
+
+
+def _pipelined(batches: Iterable, transform: Callable) -> Iterator[Tuple[int, object]]:
     """
-    Safely convert value to float with None fallback.
+    Read and transform batches on a background thread, in order.
 
-    Single Responsibility: Safe type conversion.
+    The caller inserts one chunk while the next batch is decompressed and
+    transformed; pyarrow, GEOS and the database driver all release the GIL,
+    so the stages overlap. The bounded queue applies backpressure, keeping
+    at most PIPELINE_DEPTH transformed chunks in memory.
 
     Args:
-        value: Value to convert
+        batches: Iterable of pyarrow RecordBatches
+        transform: Function applied to each batch
 
-    Returns:
-        float or None: Converted value or None if conversion fails
+    Yields:
+        tuple: (number of rows in the batch, transform result)
     """
-    if pd.notna(value) and value != "":
+    results = queue.Queue(maxsize=PIPELINE_DEPTH)
+    done = object()
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # Poll so a consumer that stopped early cannot leave us blocked
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
         try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
-    return None
+            for batch in batches:
+                if not put((batch.num_rows, transform(batch))):
+                    return
+            put(done)
+        except Exception as e:
+            put(e)
+
+    producer = threading.Thread(target=produce, name="ingest-reader", daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            item = results.get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def _report_progress(chunk_num: int, processed: int, total: int) -> bool:
+    """Return True on every PROGRESS_INTERVAL-th chunk and on the last one."""
+    return chunk_num % PROGRESS_INTERVAL == 0 or processed >= total
 
 
 def process_links_chunked(session: Session) -> int:
@@ -191,7 +421,7 @@ def process_links_chunked(session: Session) -> int:
     """
     print_step(2, "PROCESSING LINKS (CHUNKED - MEMORY OPTIMIZED)")
 
-    link_info_path = "/workspace/data/raw/link_info.parquet.gz"
+    link_info_path = prefer_zstd("/workspace/data/raw/link_info.parquet.gz")
     if not os.path.exists(link_info_path):
         raise FileNotFoundError(f"Link info dataset not found: {link_info_path}")
 
@@ -201,43 +431,33 @@ def process_links_chunked(session: Session) -> int:
     print(f"Processing links in chunks of {LINK_CHUNK_SIZE:,} records...")
 
     try:
-        # Load full dataset first, then process in chunks
-        print("  Loading link dataset...")
-        link_df = pd.read_parquet(link_info_path)
-        total_records = len(link_df)
+        # Stream the file batch by batch; only one chunk is decoded at a time
+        parquet_file = pq.ParquetFile(link_info_path, pre_buffer=True)
+        total_records = parquet_file.metadata.num_rows
         print(f"  Total records to process: {total_records:,}")
 
-        # Process in chunks using streaming pipeline
-        for start_idx in range(0, total_records, LINK_CHUNK_SIZE):
-            end_idx = min(start_idx + LINK_CHUNK_SIZE, total_records)
-            chunk_df = link_df.iloc[start_idx:end_idx]
-            chunk_num = (start_idx // LINK_CHUNK_SIZE) + 1
-
-            print(
-                f"\n  Processing chunk {chunk_num}: {len(chunk_df):,} records ({start_idx:,} to {end_idx:,})"
-            )
-
-            # Transform chunk to ORM objects
-            link_objects = _transform_link_chunk(chunk_df)
-
+        # Decoding and transforming the next chunk overlaps with this COPY
+        batches = parquet_file.iter_batches(
+            batch_size=LINK_CHUNK_SIZE, columns=LINK_COLUMNS
+        )
+        chunks = _pipelined(
+            batches, lambda batch: _transform_link_chunk(_batch_to_pandas(batch))
+        )
+        for chunk_num, (chunk_size, link_rows) in enumerate(chunks, start=1):
             # Bulk insert with error handling
-            chunk_inserted = _bulk_insert_links(session, link_objects)
+            chunk_inserted = _bulk_insert_links(session, link_rows)
 
             total_inserted += chunk_inserted
-            total_processed += len(chunk_df)
+            total_processed += chunk_size
 
-            print(f"    Chunk {chunk_num}: {chunk_inserted:,} links inserted")
-            print(
-                f"    Running total: {total_inserted:,} links inserted from {total_processed:,} processed"
-            )
-
-            # Memory cleanup - critical for large datasets
-            del link_objects, chunk_df
-            gc.collect()
+            if _report_progress(chunk_num, total_processed, total_records):
+                print(
+                    f"  Chunk {chunk_num}: {total_inserted:,} links inserted from {total_processed:,} processed"
+                )
 
-        # Final memory cleanup
-        del link_df
-        gc.collect()
+            # Release the chunk before waiting on the next one; reference
+            # counting frees it, a full gc.collect() pass is not needed
+            del link_rows
 
         print(
             f"\n✅ Links processing completed: {total_inserted:,} inserted from {total_processed:,} processed"
@@ -249,7 +469,116 @@ def process_links_chunked(session: Session) -> int:
         raise
 
 
-def process_speed_records_chunked(session: Session, existing_link_ids: Set[int]) -> int:
+def configure_load_session(session: Session) -> None:
+    """
+    Apply LOAD_SESSION_SETTINGS to the session's connection.
+
+    Committed immediately: a session-level SET is undone if its
+    transaction rolls back, and the per-chunk error handling rolls back.
+
+    Args:
+        session: Database session
+    """
+    for setting in LOAD_SESSION_SETTINGS:
+        session.execute(text(setting))
+    session.commit()
+
+
+@contextmanager
+def unlogged_tables(session: Session) -> Iterator[None]:
+    """
+    Make the ingested tables UNLOGGED for the duration of the load.
+
+    The load is a reproducible full rebuild, so writing every row to the
+    WAL buys nothing. SET LOGGED afterwards rewrites each table once,
+    which is still far cheaper than per-row WAL, and runs even if the load
+    fails so the tables are never left crash-unsafe.
+
+    Args:
+        session: Database session
+    """
+    print("Switching tables to UNLOGGED for the bulk load...")
+    for table in UNLOGGED_LOAD_TABLES:
+        session.execute(text(f"ALTER TABLE {table} SET UNLOGGED"))
+    session.commit()
+
+    try:
+        yield
+    finally:
+        # Discard any transaction left open by a failed load
+        session.rollback()
+
+        print("\nSwitching tables back to LOGGED...")
+        for table in reversed(UNLOGGED_LOAD_TABLES):
+            session.execute(text(f"ALTER TABLE {table} SET LOGGED"))
+        session.commit()
+
+
+@contextmanager
+def deferred_indexes(session: Session, table: Table) -> Iterator[None]:
+    """
+    Drop a table's indexes around a bulk load and rebuild them afterwards.
+
+    Building each index once over the loaded table is much cheaper than
+    maintaining it row by row during COPY, and yields a better-packed GiST
+    index for link geometries. Indexes come from the model's Table, so
+    they are recreated exactly as create_tables.py defines them, even if
+    the load fails.
+
+    Args:
+        session: Database session
+        table: Table whose indexes are deferred
+    """
+    indexes = sorted(table.indexes, key=lambda index: index.name)
+
+    print(f"Dropping {table.name} indexes for bulk load...")
+    for index in indexes:
+        session.execute(DropIndex(index, if_exists=True))
+    session.commit()
+
+    try:
+        yield
+    finally:
+        # Discard any transaction left open by a failed load
+        session.rollback()
+
+        print(f"\nRecreating {table.name} indexes...")
+        session.execute(text(INDEX_BUILD_MEMORY))
+        for index in indexes:
+            session.execute(CreateIndex(index, if_not_exists=True))
+        session.commit()
+        print(f"  Recreated {len(indexes)} indexes")
+
+
+@contextmanager
+def deferred_speed_record_indexes(session: Session) -> Iterator[None]:
+    """
+    Drop the speed_records indexes and link foreign key around a bulk load.
+
+    The foreign key is re-added NOT VALID and then validated in a single
+    pass once the indexes are rebuilt.
+
+    Args:
+        session: Database session
+    """
+    print("Dropping speed_records foreign key for bulk load...")
+    session.execute(text(SPEED_RECORD_FK_DROP))
+    session.commit()
+
+    try:
+        with deferred_indexes(session, SpeedRecord.__table__):
+            yield
+    finally:
+        session.rollback()
+
+        print("Recreating speed_records foreign key...")
+        session.execute(text(SPEED_RECORD_FK_ADD))
+        session.execute(text(SPEED_RECORD_FK_VALIDATE))
+        session.commit()
+        print(f"  Recreated {SPEED_RECORD_LINK_FK}")
+
+
+def process_speed_records_chunked(session: Session) -> int:
     """
     Process speed records dataset in memory-efficient chunks.
 
@@ -258,14 +587,13 @@ def process_speed_records_chunked(session: Session, existing_link_ids: Set[int])
 
     Args:
         session: Database session
-        existing_link_ids: Set of valid link IDs for referential integrity
 
     Returns:
         int: Total number of speed records inserted
     """
     print_step(3, "PROCESSING SPEED RECORDS (CHUNKED - MEMORY OPTIMIZED)")
 
-    speed_data_path = "/workspace/data/raw/duval_jan1_2024.parquet.gz"
+    speed_data_path = prefer_zstd("/workspace/data/raw/duval_jan1_2024.parquet.gz")
     if not os.path.exists(speed_data_path):
         raise FileNotFoundError(f"Speed data dataset not found: {speed_data_path}")
 
@@ -278,47 +606,34 @@ def process_speed_records_chunked(session: Session, existing_link_ids: Set[int])
     )
 
     try:
-        # Load full dataset first, then process in chunks
-        print("  Loading speed records dataset...")
-        speed_df = pd.read_parquet(speed_data_path)
-        total_records = len(speed_df)
+        # Stream the file batch by batch; only one chunk is decoded at a time
+        parquet_file = pq.ParquetFile(speed_data_path, pre_buffer=True)
+        total_records = parquet_file.metadata.num_rows
         print(f"  Total records to process: {total_records:,}")
 
-        # Process in chunks using streaming pipeline
-        for start_idx in range(0, total_records, SPEED_RECORD_CHUNK_SIZE):
-            end_idx = min(start_idx + SPEED_RECORD_CHUNK_SIZE, total_records)
-            chunk_df = speed_df.iloc[start_idx:end_idx]
-            chunk_num = (start_idx // SPEED_RECORD_CHUNK_SIZE) + 1
-
-            print(
-                f"\n  Processing chunk {chunk_num}: {len(chunk_df):,} records ({start_idx:,} to {end_idx:,})"
-            )
-
-            # Process chunk into SpeedRecord objects
-            speed_objects, chunk_skipped = _transform_speed_chunk(
-                chunk_df, existing_link_ids
+        # Decoding and transforming the next chunk overlaps with this COPY
+        batches = parquet_file.iter_batches(
+            batch_size=SPEED_RECORD_CHUNK_SIZE, columns=SPEED_RECORD_COLUMNS
+        )
+        chunks = _pipelined(
+            batches, lambda batch: _transform_speed_chunk(_batch_to_pandas(batch))
+        )
+        for chunk_num, (chunk_size, speed_copy) in enumerate(chunks, start=1):
+            # Insert current chunk with a single COPY; unknown links are skipped
+            chunk_inserted, chunk_skipped = _bulk_insert_speed_records(
+                session, speed_copy, chunk_num
             )
-
-            # Insert current chunk in batches using optimized bulk operations
-            chunk_inserted = _bulk_insert_speed_records(session, speed_objects)
             total_inserted += chunk_inserted
-            total_processed += len(chunk_df)
+            total_processed += chunk_size
             total_skipped += chunk_skipped
 
-            print(
-                f"    Chunk {chunk_num}: {chunk_inserted:,} speed records inserted, {chunk_skipped:,} skipped"
-            )
-            print(
-                f"    Running total: {total_inserted:,} inserted, {total_skipped:,} skipped from {total_processed:,} processed"
-            )
-
-            # Memory cleanup - critical for large datasets
-            del speed_objects, chunk_df
-            gc.collect()  # Force garbage collection
+            if _report_progress(chunk_num, total_processed, total_records):
+                print(
+                    f"  Chunk {chunk_num}: {total_inserted:,} inserted, {total_skipped:,} skipped from {total_processed:,} processed"
+                )
 
-        # Final memory cleanup
-        del speed_df
-        gc.collect()
+            # Release the chunk before waiting on the next one
+            del speed_copy
 
         print(
             f"\n✅ Speed records processing completed: {total_inserted:,} inserted, {total_skipped:,} skipped from {total_processed:,} processed"
@@ -330,72 +645,9 @@ def process_speed_records_chunked(session: Session, existing_link_ids: Set[int])
         raise
 
 
-def insert_links_batch(
-    session: Session, link_objects: List[Link], batch_size: int
-) -> int:
-    """Insert links in smaller batches with error handling."""
-    total_inserted = 0
-
-    try:
-        for i in range(0, len(link_objects), batch_size):
-            batch = link_objects[i : i + batch_size]
-
-            try:
-                session.bulk_save_objects(batch)
-                session.commit()
-                total_inserted += len(batch)
-
-            except Exception as e:
-                session.rollback()
-                print(f"    Error inserting batch, retrying individually...")
-
-                # Try individual inserts for this batch
-                for link_obj in batch:
-                    try:
-                        session.add(link_obj)
-                        session.commit()
-                        total_inserted += 1
-                    except Exception:
-                        session.rollback()
-                        continue
-
-    except Exception as e:
-        print(f"Critical error in batch insertion: {e}")
-        session.rollback()
-
-    return total_inserted
-
-
-def insert_speed_records_batch(
-    session: Session, speed_objects: List[SpeedRecord], batch_size: int
-) -> int:
-    """Insert speed records in smaller batches with error handling."""
-    total_inserted = 0
-
-    try:
-        for i in range(0, len(speed_objects), batch_size):
-            batch = speed_objects[i : i + batch_size]
-
-            try:
-                session.bulk_save_objects(batch)
-                session.commit()
-                total_inserted += len(batch)
-
-            except Exception as e:
-                session.rollback()
-                # Skip problematic batches for speed records to maintain performance
-                continue
-
-    except Exception as e:
-        print(f"Critical error in speed record batch insertion: {e}")
-        session.rollback()
-
-    return total_inserted
-
-
-def _transform_link_chunk(chunk_df: pd.DataFrame) -> List[Link]:
+def _transform_link_chunk(chunk_df: pd.DataFrame) -> List[LinkRow]:
     """
-    Transform a chunk of link data into Link ORM objects.
+    Transform a chunk of link data into rows for COPY.
 
     Single Responsibility: Only handles data transformation.
 
@@ -403,193 +655,297 @@ def _transform_link_chunk(chunk_df: pd.DataFrame) -> List[Link]:
         chunk_df: DataFrame chunk with link data
 
     Returns:
-        List[Link]: Transformed Link objects
+        List[LinkRow]: (link_id, road_name, length, geometry EWKB) tuples
     """
-    link_objects = []
+    # Convert the whole chunk's geometries at once
+    ewkb_values = convert_geometries_to_ewkb(
+        chunk_df["geo_json"].to_numpy(dtype=object, na_value=None)
+    )
 
-    for idx, row in chunk_df.iterrows():
-        try:
-            # Convert geometry
-            geometry_element = convert_geometry_to_wkt_element(row["geo_json"])
-            if not geometry_element:
-                continue
+    # Column-wise conversions; missing or unparseable values become None
+    road_names = chunk_df["road_name"].to_numpy(dtype=object, na_value=None)
+    lengths = pd.to_numeric(chunk_df["_length"], errors="coerce").to_numpy(
+        dtype=object, na_value=None
+    )
 
-            # Convert length to float
-            length = _safe_float_conversion(row.get("_length"))
-
-            # Create Link ORM object
-            link_obj = Link(
-                link_id=int(row["link_id"]),
-                road_name=row["road_name"] if pd.notna(row["road_name"]) else None,
-                length=length,
-                road_type=None,  # Not in dataset
-                speed_limit=None,  # Not in dataset
-                geometry=geometry_element,
-            )
+    # Skip links whose geometry could not be converted
+    valid_mask = pd.notna(ewkb_values)
 
-            link_objects.append(link_obj)
+    link_rows = list(
+        zip(
+            chunk_df["link_id"].to_numpy(dtype=np.int64)[valid_mask].tolist(),
+            road_names[valid_mask].tolist(),
+            lengths[valid_mask].tolist(),
+            ewkb_values[valid_mask].tolist(),
+        )
+    )
+
+    return link_rows
 
-        except Exception as e:
-            print(f"    Error processing link {row.get('link_id', 'unknown')}: {e}")
-            continue
 
-    return link_objects
+def _encode_links_binary(link_rows: List[LinkRow]) -> bytes:
+    """
+    Encode link rows in the PostgreSQL COPY BINARY format.
 
+    Geometries are sent as raw EWKB, half the size of hex text.
 
-def _bulk_insert_links(session: Session, link_objects: List[Link]) -> int:
+    Args:
+        link_rows: Rows produced by _transform_link_chunk
+
+    Returns:
+        bytes: Complete COPY BINARY payload including header and trailer
     """
-    Bulk insert links using optimized batch operations.
+    parts = [PG_COPY_HEADER]
+    for link_id, road_name, length, ewkb in link_rows:
+        parts.append(LINK_BINARY_HEAD.pack(4, 4, link_id))
+        parts.append(_binary_text_field(road_name))
+        if length is None:
+            parts.append(PG_COPY_NULL)
+        else:
+            parts.append(FLOAT8_FIELD.pack(8, length))
+        parts.append(struct.pack(">i", len(ewkb)))
+        parts.append(ewkb)
+    parts.append(PG_COPY_TRAILER)
+    return b"".join(parts)
+
+
+def _copy_payload(session: Session, copy_sql: str, payload: io.IOBase) -> None:
+    """Run COPY ... FROM STDIN on the session's connection, reading payload."""
+    dbapi_connection = session.connection().connection
+    with dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(copy_sql, payload, size=COPY_BUFFER_SIZE)
+
+
+def _bulk_insert_links(session: Session, link_rows: List[LinkRow]) -> int:
+    """
+    Bulk insert links with a single COPY.
 
     Single Responsibility: Only handles bulk insertion.
 
     Args:
         session: Database session
-        link_objects: List of Link objects to insert
+        link_rows: Rows produced by _transform_link_chunk
 
     Returns:
         int: Number of successfully inserted links
     """
-    total_inserted = 0
+    if not link_rows:
+        return 0
 
     try:
-        for i in range(0, len(link_objects), LINK_BATCH_SIZE):
-            batch = link_objects[i : i + LINK_BATCH_SIZE]
-
-            try:
-                session.bulk_save_objects(batch)
-                session.commit()
-                total_inserted += len(batch)
-
-            except Exception as e:
-                session.rollback()
-                print(f"    Error inserting batch, retrying individually...")
-
-                # Fallback: individual inserts for error recovery
-                for link_obj in batch:
-                    try:
-                        session.add(link_obj)
-                        session.commit()
-                        total_inserted += 1
-                    except Exception:
-                        session.rollback()
-                        continue
+        payload = _encode_links_binary(link_rows)
+        _copy_payload(session, LINK_COPY, io.BytesIO(payload))
+        session.commit()
+        return len(link_rows)
 
     except Exception as e:
-        print(f"Critical error in bulk link insertion: {e}")
         session.rollback()
+        reject_path = _write_link_rejects(link_rows)
+        print(f"    Error copying chunk ({e}), rows written to {reject_path}")
+        return 0
+
+
+def _write_link_rejects(link_rows: List[LinkRow]) -> str:
+    """
+    Save a chunk that failed to load to a Parquet reject file for inspection.
+
+    Args:
+        link_rows: Rows produced by _transform_link_chunk
 
-    return total_inserted
+    Returns:
+        str: Path of the written reject file
+    """
+    link_ids, road_names, lengths, geometries = zip(*link_rows)
+    table = pa.table(
+        {
+            "link_id": pa.array(link_ids, pa.int32()),
+            "road_name": pa.array(road_names, pa.string()),
+            "length": pa.array(lengths, pa.float64()),
+            "geometry_ewkb": pa.array(geometries, pa.binary()),
+        }
+    )
+
+    os.makedirs(REJECT_DIR, exist_ok=True)
+    reject_path = os.path.join(REJECT_DIR, f"links_{link_ids[0]}.parquet")
+    pq.write_table(table, reject_path)
+    return reject_path
 
 
-def _transform_speed_chunk(
-    chunk_df: pd.DataFrame, existing_link_ids: Set[int]
-) -> tuple[List[SpeedRecord], int]:
+def _transform_speed_chunk(chunk_df: pd.DataFrame) -> SpeedRecordCopy:
     """
-    Transform a chunk of speed data into SpeedRecord ORM objects.
+    Transform a chunk of speed data into a COPY BINARY payload.
 
     Single Responsibility: Only handles speed data transformation.
 
     Args:
         chunk_df: DataFrame chunk with speed data
-        existing_link_ids: Set of valid link IDs for referential integrity
 
     Returns:
-        tuple: (List of SpeedRecord objects, number of skipped records)
+        SpeedRecordCopy: (payload, columns), link IDs not yet checked
     """
-    speed_objects = []
-    skipped_count = 0
+    link_ids = chunk_df["link_id"].to_numpy(dtype=np.int64)
 
-    for idx, row in chunk_df.iterrows():
-        try:
-            link_id = int(row["link_id"])
+    # Parse the chunk's timestamps in one call; bad values become NaT
+    parsed_times = pd.to_datetime(
+        chunk_df["date_time"], format="ISO8601", utc=True, errors="coerce"
+    )
 
-            # Skip if link doesn't exist (referential integrity)
-            if link_id not in existing_link_ids:
-                skipped_count += 1
-                continue
+    # Naive UTC, truncated to whole seconds for the timestamp column
+    times = parsed_times.dt.tz_localize(None).to_numpy().astype("datetime64[s]")
 
-            # Convert datetime
-            timestamp = pd.to_datetime(row["date_time"])
-            period_name = PERIOD_MAPPING.get(row["period"], None)
+    # Drop rows whose date_time could not be parsed
+    row_mask = ~np.isnat(times)
+    invalid_timestamps = int((~row_mask).sum())
+    if invalid_timestamps:
+        print(
+            f"    Error processing {invalid_timestamps:,} speed records: bad date_time"
+        )
 
-            # Extract day of week from timestamp
-            day_of_week = timestamp.strftime("%A")  # Monday, Tuesday, etc.
+    # Column-wise conversions on NumPy arrays; no per-row pandas access
+    naive_times = times[row_mask]
+    # 1970-01-01 was a Thursday, dayofweek 3 with Monday == 0
+    days = (naive_times.astype("datetime64[D]").view(np.int64) + 3) % 7
+    periods = chunk_df["period"].to_numpy()[row_mask]
+    period_codes = np.where((periods > 0) & (periods < PERIOD_CODES), periods, 0)
+    tail_codes = (days * PERIOD_CODES + period_codes).astype(np.intp)
+    speeds = chunk_df["average_speed"].to_numpy(dtype=np.float64)[row_mask]
+
+    columns = (link_ids[row_mask], naive_times, speeds, tail_codes)
+    return _encode_speed_records_binary(*columns), columns
+
+
+def _encode_speed_records_binary(
+    link_ids: np.ndarray,
+    timestamps: np.ndarray,
+    speeds: np.ndarray,
+    tail_codes: np.ndarray,
+) -> bytes:
+    """
+    Encode speed records in the PostgreSQL COPY BINARY format.
 
-            # Create SpeedRecord ORM object
-            speed_obj = SpeedRecord(
-                link_id=link_id,
-                timestamp=timestamp,
-                speed=float(row["average_speed"]),
-                time_period=period_name,
-                day_of_week=day_of_week,
-            )
+    The fixed-width head of every row is filled through a structured array.
+    The day_of_week and time_period text is copied from SPEED_RECORD_TAILS
+    with one vectorized assignment per distinct (day, period) pair, so no
+    per-row Python code runs.
 
-            speed_objects.append(speed_obj)
+    Args:
+        link_ids: Link IDs
+        timestamps: Naive UTC timestamps (datetime64)
+        speeds: Average speeds
+        tail_codes: Indexes into SPEED_RECORD_TAILS
 
-        except Exception as e:
-            print(f"    Error processing speed record {idx}: {e}")
-            continue
+    Returns:
+        bytes: Complete COPY BINARY payload including header and trailer
+    """
+    row_count = len(link_ids)
+    head = np.empty(row_count, dtype=SPEED_RECORD_BINARY_HEAD)
+    head["field_count"] = 5
+    head["link_id_size"] = 4
+    head["link_id"] = link_ids
+    head["timestamp_size"] = 8
+    head["timestamp"] = (timestamps - PG_EPOCH).astype(np.int64)
+    head["speed_size"] = 8
+    head["speed"] = speeds
+
+    # Byte offset of every row in the payload body
+    head_size = SPEED_RECORD_BINARY_HEAD.itemsize
+    row_sizes = head_size + SPEED_RECORD_TAIL_SIZES[tail_codes]
+    row_starts = np.cumsum(row_sizes) - row_sizes
+
+    body = np.empty(int(row_sizes.sum()), dtype=np.uint8)
+    body[row_starts[:, None] + np.arange(head_size)] = head.view(np.uint8).reshape(
+        row_count, head_size
+    )
+    for code in np.unique(tail_codes):
+        tail = SPEED_RECORD_TAILS[code]
+        tail_starts = row_starts[tail_codes == code] + head_size
+        body[tail_starts[:, None] + np.arange(len(tail))] = tail
 
-    return speed_objects, skipped_count
+    return PG_COPY_HEADER + body.tobytes() + PG_COPY_TRAILER
 
 
 def _bulk_insert_speed_records(
-    session: Session, speed_objects: List[SpeedRecord]
-) -> int:
+    session: Session, speed_copy: SpeedRecordCopy, chunk_num: int
+) -> Tuple[int, int]:
     """
-    Bulk insert speed records using optimized batch operations.
+    Bulk insert speed records with binary COPY into a staging table.
 
     Single Responsibility: Only handles bulk insertion of speed records.
+    Rows whose link_id is not in links are dropped by the join in
+    PostgreSQL, using the links primary key index.
 
     Args:
         session: Database session
-        speed_objects: List of SpeedRecord objects to insert
+        speed_copy: Payload produced by _transform_speed_chunk
+        chunk_num: Chunk number, used to name the reject file
 
     Returns:
-        int: Number of successfully inserted speed records
+        tuple: (number of inserted records, number skipped for unknown links)
     """
-    total_inserted = 0
+    payload, columns = speed_copy
+    row_count = len(columns[0])
+    if not row_count:
+        return 0, 0
 
     try:
-        for i in range(0, len(speed_objects), SPEED_BATCH_SIZE):
-            batch = speed_objects[i : i + SPEED_BATCH_SIZE]
-
-            try:
-                session.bulk_save_objects(batch)
-                session.commit()
-                total_inserted += len(batch)
-
-            except Exception as e:
-                session.rollback()
-                # Skip problematic batches for speed records to maintain performance
-                continue
+        session.execute(text(SPEED_RECORD_STAGING_DDL))
+        _copy_payload(session, SPEED_RECORD_STAGING_COPY, io.BytesIO(payload))
+        inserted = session.execute(text(SPEED_RECORD_STAGING_INSERT)).rowcount
+        session.commit()
+        return inserted, row_count - inserted
 
     except Exception as e:
-        print(f"Critical error in bulk speed record insertion: {e}")
         session.rollback()
+        reject_path = _write_speed_record_rejects(columns, chunk_num)
+        print(
+            f"    Error copying speed records chunk ({e}), rows written to {reject_path}"
+        )
+        return 0, 0
+
+
+def _write_speed_record_rejects(columns: SpeedRecordColumns, chunk_num: int) -> str:
+    """
+    Save a speed record chunk that failed to load to a Parquet reject file.
+
+    Args:
+        columns: Columns produced by _transform_speed_chunk
+        chunk_num: Chunk number, used in the file name
+
+    Returns:
+        str: Path of the written reject file
+    """
+    link_ids, timestamps, speeds, tail_codes = columns
+    days, periods = np.divmod(tail_codes, PERIOD_CODES)
+    table = pa.table(
+        {
+            "link_id": pa.array(link_ids, pa.int32()),
+            "timestamp": pa.array(timestamps, pa.timestamp("s")),
+            "speed": pa.array(speeds, pa.float64()),
+            "day_of_week": pa.array(np.array(DAY_NAMES, dtype=object)[days]),
+            "time_period": pa.array(np.array(PERIOD_LUT, dtype=object)[periods]),
+        }
+    )
 
-    return total_inserted
+    os.makedirs(REJECT_DIR, exist_ok=True)
+    reject_path = os.path.join(REJECT_DIR, f"speed_records_{chunk_num}.parquet")
+    pq.write_table(table, reject_path)
+    return reject_path
 
 
 def clear_existing_data_orm(session: Session):
     """
-    Clear existing data from tables using ORM.
+    Clear existing data from tables with a single TRUNCATE.
 
     Single Responsibility: Only handles data cleanup.
+    Unlike DELETE, TRUNCATE neither scans nor WAL-logs each row and
+    returns the space to the filesystem immediately.
     """
     print_step(1, "CLEARING EXISTING DATA")
 
     try:
-        # Clear speed records first (foreign key constraint)
-        print("Clearing speed_records table...")
-        deleted_speeds = session.query(SpeedRecord).delete()
-        print(f"  Deleted {deleted_speeds:,} speed records")
-
-        # Clear links
-        print("Clearing links table...")
-        deleted_links = session.query(Link).delete()
-        print(f"  Deleted {deleted_links:,} links")
-
+        # Both tables in one statement, so the foreign key is satisfied
+        print("Truncating speed_records and links tables...")
+        session.execute(text(TRUNCATE_TABLES))
         session.commit()
         print("  Data cleared successfully")
 
@@ -599,29 +955,6 @@ def clear_existing_data_orm(session: Session):
         raise
 
 
-def get_existing_link_ids(session: Session) -> Set[int]:
-    """
-    Get set of existing link IDs for referential integrity.
-
-    Single Responsibility: Only handles link ID retrieval.
-
-    Returns:
-        Set[int]: Set of existing link IDs
-    """
-    print("Getting existing link IDs for referential integrity...")
-
-    try:
-        # Query all link_ids efficiently
-        result = session.query(Link.link_id).all()
-        link_ids = {row.link_id for row in result}
-        print(f"  Found {len(link_ids):,} existing links")
-        return link_ids
-
-    except Exception as e:
-        print(f"Error getting existing link IDs: {e}")
-        return set()
-
-
 def verify_data_orm(session: Session):
     """
     Verify inserted data using ORM queries.
@@ -9,22 +9,27 @@ comparison to ensure data integrity and accuracy.
 This is NOT a unit test - it's a validation tool for production data quality.
 """
 
-import json
 import os
 import sys
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 
 sys.path.insert(0, "/workspace")
 
-from shapely.geometry import MultiLineString, shape
-from sqlalchemy import text
+from sqlalchemy import select, text, tuple_
 
 from app.core.database import get_session_factory
-from app.models.link import Link
 from app.models.speed_record import SpeedRecord
 
+# Link columns compared against the database
+LINK_COLUMNS = ["link_id", "road_name", "_length", "geo_json"]
+
+# Speed columns used by both the sample checks and the statistical checks
+SPEED_COLUMNS = ["link_id", "date_time", "average_speed", "period"]
+
 
 class DataValidationError(Exception):
     """Custom exception for data validation errors."""
@@ -45,28 +50,42 @@ def main():
         sample_size = 50  # Number of records to validate in detail
 
         # Load sample data
-        link_sample, speed_sample = load_sample_parquet_data(sample_size)
-
-        # Run validations
-        validations = [
-            ("Link Data Validation", lambda: validate_link_data(link_sample)),
-            ("Speed Data Validation", lambda: validate_speed_data(speed_sample)),
-            ("Data Integrity Validation", validate_data_integrity),
-            ("Statistical Consistency Validation", validate_statistical_consistency),
-        ]
-
-        all_passed = True
-        results = {}
-
-        for validation_name, validation_func in validations:
-            try:
-                passed = validation_func()
-                results[validation_name] = passed
-                all_passed = all_passed and passed
-            except Exception as e:
-                print_result(False, f"{validation_name} failed with error: {e}")
-                results[validation_name] = False
-                all_passed = False
+        link_sample, speed_sample, speed_df = load_sample_parquet_data(sample_size)
+
+        # One session, and so one pooled connection, serves every validation
+        Session = get_session_factory()
+        with Session() as session:
+            # Run validations
+            validations = [
+                (
+                    "Link Data Validation",
+                    lambda: validate_link_data(session, link_sample),
+                ),
+                (
+                    "Speed Data Validation",
+                    lambda: validate_speed_data(session, speed_sample),
+                ),
+                ("Data Integrity Validation", lambda: validate_data_integrity(session)),
+                (
+                    "Statistical Consistency Validation",
+                    lambda: validate_statistical_consistency(session, speed_df),
+                ),
+            ]
+
+            all_passed = True
+            results = {}
+
+            for validation_name, validation_func in validations:
+                try:
+                    passed = validation_func()
+                    results[validation_name] = passed
+                    all_passed = all_passed and passed
+                except Exception as e:
+                    # Clear the aborted transaction before the next check
+                    session.rollback()
+                    print_result(False, f"{validation_name} failed with error: {e}")
+                    results[validation_name] = False
+                    all_passed = False
 
         # Final results
         print_section("VALIDATION RESULTS SUMMARY")
@@ -111,8 +130,13 @@ def print_result(passed: bool, message: str):
 
 def load_sample_parquet_data(
     sample_size: int = 100,
-) -> Tuple[pd.DataFrame, pd.DataFrame]:
-    """Load sample data from original Parquet files."""
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Load sample data from original Parquet files.
+
+    The speed file is read once, limited to SPEED_COLUMNS, and returned with
+    the samples so the statistical checks can reuse it.
+    """
     print_section("LOADING SAMPLE PARQUET DATA")
 
     # Load Link Info Dataset
@@ -120,11 +144,15 @@ def load_sample_parquet_data(
     if not os.path.exists(link_info_path):
         raise FileNotFoundError(f"Link info dataset not found: {link_info_path}")
 
-    link_df = pd.read_parquet(link_info_path)
-    print(f"Total links in Parquet: {len(link_df):,}")
+    link_table = pq.read_table(link_info_path, columns=LINK_COLUMNS)
+    print(f"Total links in Parquet: {link_table.num_rows:,}")
 
-    # Sample links (ensure we get a representative sample)
-    link_sample = link_df.sample(n=min(sample_size, len(link_df)), random_state=42)
+    # Sample links (same rows as DataFrame.sample with random_state=42), and
+    # convert only the sampled rows to pandas
+    positions = np.random.RandomState(42).choice(
+        link_table.num_rows, size=min(sample_size, link_table.num_rows), replace=False
+    )
+    link_sample = link_table.take(positions).to_pandas()
     print(f"Selected {len(link_sample)} link samples")
 
     # Load Speed Data Dataset
@@ -132,7 +160,7 @@ def load_sample_parquet_data(
     if not os.path.exists(speed_data_path):
         raise FileNotFoundError(f"Speed data dataset not found: {speed_data_path}")
 
-    speed_df = pd.read_parquet(speed_data_path)
+    speed_df = pd.read_parquet(speed_data_path, columns=SPEED_COLUMNS)
     print(f"Total speed records in Parquet: {len(speed_df):,}")
 
     # Sample speed records from the same links we sampled
@@ -149,135 +177,110 @@ def load_sample_parquet_data(
 
     print(f"Selected {len(speed_sample)} speed record samples")
 
-    return link_sample, speed_sample
+    return link_sample, speed_sample, speed_df
 
 
-def validate_link_data(link_sample: pd.DataFrame) -> bool:
+def validate_link_data(session, link_sample: pd.DataFrame) -> bool:
     """Validate link data between Parquet and database."""
     print_section("VALIDATING LINK DATA")
 
-    Session = get_session_factory()
     all_passed = True
 
-    with Session() as session:
-        for idx, parquet_row in link_sample.iterrows():
-            link_id = int(parquet_row["link_id"])
-
-            # Get corresponding database record
-            db_link = session.query(Link).filter(Link.link_id == link_id).first()
-
-            if not db_link:
-                all_passed = print_result(
-                    False, f"Link {link_id} not found in database"
-                )
-                continue
-
-            # Validate basic fields
-            expected_road_name = (
-                parquet_row["road_name"] if pd.notna(parquet_row["road_name"]) else None
+    # Fetch every sampled link in one round trip. PostGIS compares each
+    # stored geometry with the Parquet GeoJSON, reduced to its first part
+    # and snapped to 6 decimals, so no geometry is parsed in Python.
+    link_ids = link_sample["link_id"].astype(int).tolist()
+    geo_jsons = link_sample["geo_json"].to_numpy(dtype=object, na_value=None).tolist()
+    rows = session.execute(
+        text(
+            """
+        SELECT l.link_id, l.road_name, l.length,
+               l.geometry IS NOT NULL AS has_geometry,
+               ST_Equals(
+                   ST_SnapToGrid(l.geometry, 0.000001),
+                   ST_SnapToGrid(
+                       ST_SetSRID(
+                           ST_GeometryN(ST_Multi(ST_GeomFromGeoJSON(s.geo_json)), 1),
+                           4326
+                       ),
+                       0.000001
+                   )
+               ) AS geometry_matches
+        FROM unnest(CAST(:ids AS bigint[]), CAST(:geo_jsons AS text[]))
+             AS s(link_id, geo_json)
+        JOIN links l ON l.link_id = s.link_id
+    """
+        ),
+        {"ids": link_ids, "geo_jsons": geo_jsons},
+    ).all()
+    db_links = {row.link_id: row for row in rows}
+
+    # Expected values as plain Python lists, with None for missing entries
+    road_names = link_sample["road_name"].to_numpy(dtype=object, na_value=None)
+    lengths = pd.to_numeric(link_sample["_length"], errors="coerce")
+    expected_lengths = lengths.astype(object).where(lengths.notna(), None)
+
+    for link_id, expected_road_name, expected_length in zip(
+        link_ids, road_names.tolist(), expected_lengths.tolist()
+    ):
+        db_link = db_links.get(link_id)
+
+        if not db_link:
+            all_passed = print_result(False, f"Link {link_id} not found in database")
+            continue
+
+        # Validate basic fields
+        actual_road_name = db_link.road_name
+
+        if expected_road_name != actual_road_name:
+            all_passed = print_result(
+                False,
+                f"Link {link_id} road_name mismatch: expected '{expected_road_name}', got '{actual_road_name}'",
             )
-            actual_road_name = db_link.road_name
+            continue
 
-            if expected_road_name != actual_road_name:
-                all_passed = print_result(
-                    False,
-                    f"Link {link_id} road_name mismatch: expected '{expected_road_name}', got '{actual_road_name}'",
-                )
-                continue
+        # Validate length (with tolerance for float precision)
+        actual_length = db_link.length
 
-            # Validate length (with tolerance for float precision)
-            expected_length = None
-            if pd.notna(parquet_row["_length"]) and parquet_row["_length"] != "":
-                try:
-                    expected_length = float(parquet_row["_length"])
-                except (ValueError, TypeError):
-                    expected_length = None
-
-            actual_length = db_link.length
-
-            if expected_length is not None and actual_length is not None:
-                if (
-                    abs(expected_length - actual_length) > 0.0001
-                ):  # Tolerance for float precision
-                    all_passed = print_result(
-                        False,
-                        f"Link {link_id} length mismatch: expected {expected_length}, got {actual_length}",
-                    )
-                    continue
-            elif expected_length != actual_length:  # Both None or one is None
+        if expected_length is not None and actual_length is not None:
+            if (
+                abs(expected_length - actual_length) > 0.0001
+            ):  # Tolerance for float precision
                 all_passed = print_result(
                     False,
                     f"Link {link_id} length mismatch: expected {expected_length}, got {actual_length}",
                 )
                 continue
+        elif expected_length != actual_length:  # Both None or one is None
+            all_passed = print_result(
+                False,
+                f"Link {link_id} length mismatch: expected {expected_length}, got {actual_length}",
+            )
+            continue
 
-            # Validate geometry
-            if not validate_link_geometry(session, link_id, parquet_row["geo_json"]):
-                all_passed = False
-                continue
-
-            print_result(True, f"Link {link_id} validation passed")
-
-    return all_passed
-
-
-def validate_link_geometry(session, link_id: int, original_geojson: str) -> bool:
-    """Validate geometry data for a specific link."""
-    try:
-        # Parse original GeoJSON
-        if isinstance(original_geojson, str):
-            geo_data = json.loads(original_geojson)
-        else:
-            geo_data = original_geojson
-
-        # Convert to Shapely geometry
-        original_geom = shape(geo_data)
+        # Validate geometry
+        if not db_link.has_geometry:
+            all_passed = print_result(
+                False, f"Link {link_id} has no geometry in database"
+            )
+            continue
 
-        # Handle MultiLineString to LineString conversion (as done in ingestion)
-        if original_geom.geom_type == "MultiLineString":
-            if (
-                isinstance(original_geom, MultiLineString)
-                and len(original_geom.geoms) > 0
-            ):
-                original_geom = original_geom.geoms[0]
-            else:
-                return print_result(False, f"Link {link_id} has empty MultiLineString")
-
-        # Get geometry from database as GeoJSON
-        result = session.execute(
-            text(
-                "SELECT ST_AsGeoJSON(geometry, 6) as geom_json FROM links WHERE link_id = :link_id"
-            ),
-            {"link_id": link_id},
-        ).fetchone()
-
-        if not result or not result.geom_json:
-            return print_result(False, f"Link {link_id} has no geometry in database")
-
-        # Parse database GeoJSON
-        db_geo_data = json.loads(result.geom_json)
-        db_geom = shape(db_geo_data)
-
-        # Compare geometries (with small tolerance for precision)
-        if not original_geom.equals(db_geom):
-            # Check if they're almost equal (allowing for small precision differences)
-            if original_geom.distance(db_geom) > 0.000001:  # Very small tolerance
-                return print_result(
-                    False,
-                    f"Link {link_id} geometry mismatch: shapes significantly different",
-                )
+        if not db_link.geometry_matches:
+            all_passed = print_result(
+                False,
+                f"Link {link_id} geometry mismatch: shapes significantly different",
+            )
+            continue
 
-        return True
+        print_result(True, f"Link {link_id} validation passed")
 
-    except Exception as e:
-        return print_result(False, f"Link {link_id} geometry validation error: {e}")
+    return all_passed
 
 
-def validate_speed_data(speed_sample: pd.DataFrame) -> bool:
+def validate_speed_data(session, speed_sample: pd.DataFrame) -> bool:
     """Validate speed data between Parquet and database."""
     print_section("VALIDATING SPEED DATA")
 
-    Session = get_session_factory()
     all_passed = True
 
     # Period mapping (same as in ingestion script)
@@ -291,194 +294,224 @@ def validate_speed_data(speed_sample: pd.DataFrame) -> bool:
         7: "Evening",
     }
 
-    with Session() as session:
-        for idx, parquet_row in speed_sample.iterrows():
-            link_id = int(parquet_row["link_id"])
-            timestamp = pd.to_datetime(parquet_row["date_time"])
-            expected_speed = float(parquet_row["average_speed"])
-            expected_period = period_mapping.get(parquet_row["period"], None)
-
-            # Find corresponding database record
-            db_speed = (
-                session.query(SpeedRecord)
-                .filter(
-                    SpeedRecord.link_id == link_id, SpeedRecord.timestamp == timestamp
-                )
-                .first()
+    # Timestamps are stored as naive UTC, as in the ingestion script
+    timestamps = pd.to_datetime(speed_sample["date_time"], utc=True).dt.tz_localize(
+        None
+    )
+    keys = [
+        (int(link_id), timestamp.to_pydatetime())
+        for link_id, timestamp in zip(speed_sample["link_id"], timestamps)
+    ]
+
+    # Fetch every sampled record in one round trip
+    rows = session.execute(
+        select(
+            SpeedRecord.link_id,
+            SpeedRecord.timestamp,
+            SpeedRecord.speed,
+            SpeedRecord.time_period,
+        ).where(tuple_(SpeedRecord.link_id, SpeedRecord.timestamp).in_(keys))
+    ).all()
+    db_speeds = {}
+    for row in rows:
+        db_speeds.setdefault((row.link_id, row.timestamp), row)
+
+    # Expected values, converted once for the whole sample
+    expected_speeds = speed_sample["average_speed"].to_numpy(dtype=np.float64)
+    expected_periods = [
+        period_mapping.get(period) for period in speed_sample["period"].tolist()
+    ]
+
+    for (link_id, timestamp), expected_speed, expected_period in zip(
+        keys, expected_speeds.tolist(), expected_periods
+    ):
+        # Find corresponding database record
+        db_speed = db_speeds.get((link_id, timestamp))
+
+        if not db_speed:
+            all_passed = print_result(
+                False,
+                f"Speed record for link {link_id} at {timestamp} not found in database",
             )
+            continue
 
-            if not db_speed:
-                all_passed = print_result(
-                    False,
-                    f"Speed record for link {link_id} at {timestamp} not found in database",
-                )
-                continue
-
-            # Validate speed (with tolerance for float precision)
-            if abs(expected_speed - db_speed.speed) > 0.01:  # 0.01 mph tolerance
-                all_passed = print_result(
-                    False,
-                    f"Speed mismatch for link {link_id}: expected {expected_speed}, got {db_speed.speed}",
-                )
-                continue
-
-            # Validate time period
-            if expected_period != db_speed.time_period:
-                all_passed = print_result(
-                    False,
-                    f"Time period mismatch for link {link_id}: expected '{expected_period}', got '{db_speed.time_period}'",
-                )
-                continue
+        # Validate speed (with tolerance for float precision)
+        if abs(expected_speed - db_speed.speed) > 0.01:  # 0.01 mph tolerance
+            all_passed = print_result(
+                False,
+                f"Speed mismatch for link {link_id}: expected {expected_speed}, got {db_speed.speed}",
+            )
+            continue
 
-            print_result(
-                True,
-                f"Speed record for link {link_id} at {timestamp} validation passed",
+        # Validate time period
+        if expected_period != db_speed.time_period:
+            all_passed = print_result(
+                False,
+                f"Time period mismatch for link {link_id}: expected '{expected_period}', got '{db_speed.time_period}'",
             )
+            continue
+
+        print_result(
+            True,
+            f"Speed record for link {link_id} at {timestamp} validation passed",
+        )
 
     return all_passed
 
 
-def validate_data_integrity() -> bool:
+def validate_data_integrity(session) -> bool:
     """Validate overall data integrity and relationships."""
     print_section("VALIDATING DATA INTEGRITY")
 
-    Session = get_session_factory()
     all_passed = True
 
-    with Session() as session:
-        # Check that all speed records have valid links
-        orphaned_speeds = session.execute(
-            text(
-                """
-            SELECT COUNT(*) as count
-            FROM speed_records s
-            LEFT JOIN links l ON s.link_id = l.link_id
-            WHERE l.link_id IS NULL
-        """
-            )
-        ).fetchone()
-
-        if orphaned_speeds.count > 0:
-            all_passed = print_result(
-                False,
-                f"Found {orphaned_speeds.count} orphaned speed records (no corresponding link)",
-            )
-        else:
-            print_result(True, "All speed records have valid link references")
-
-        # Check that all links have valid geometries
-        invalid_geometries = session.execute(
-            text(
-                """
-            SELECT COUNT(*) as count
-            FROM links
-            WHERE geometry IS NULL OR NOT ST_IsValid(geometry)
-        """
-            )
-        ).fetchone()
+    # All three checks run in a single round trip.
+    # - Orphaned speed records: a validated foreign key already rules them
+    #   out, so the anti-join only runs without one.
+    # - Invalid geometries: the predicate matches the idx_link_invalid_geometry
+    #   partial index, which is empty when healthy.
+    # - SRIDs: every distinct value, NULL included.
+    integrity = session.execute(
+        text(
+            """
+        SELECT
+            CASE
+                WHEN EXISTS (
+                    SELECT 1
+                    FROM pg_constraint
+                    WHERE conrelid = 'speed_records'::regclass
+                      AND confrelid = 'links'::regclass
+                      AND contype = 'f'
+                      AND convalidated
+                ) THEN 0
+                ELSE (
+                    SELECT COUNT(*)
+                    FROM speed_records s
+                    LEFT JOIN links l ON s.link_id = l.link_id
+                    WHERE l.link_id IS NULL
+                )
+            END AS orphaned_speeds,
+            (
+                SELECT COUNT(*)
+                FROM links
+                WHERE geometry IS NULL OR NOT ST_IsValid(geometry)
+            ) AS invalid_geometries,
+            (SELECT array_agg(DISTINCT ST_SRID(geometry)) FROM links) AS srids
+    """
+        )
+    ).one()
 
-        if invalid_geometries.count > 0:
-            all_passed = print_result(
-                False, f"Found {invalid_geometries.count} links with invalid geometries"
-            )
-        else:
-            print_result(True, "All links have valid geometries")
+    # Check that all speed records have valid links
+    if integrity.orphaned_speeds > 0:
+        all_passed = print_result(
+            False,
+            f"Found {integrity.orphaned_speeds} orphaned speed records (no corresponding link)",
+        )
+    else:
+        print_result(True, "All speed records have valid link references")
 
-        # Check coordinate system consistency
-        srid_check = session.execute(
-            text(
-                """
-            SELECT DISTINCT ST_SRID(geometry) as srid, COUNT(*) as count
-            FROM links
-            GROUP BY ST_SRID(geometry)
-        """
-            )
-        ).fetchall()
+    # Check that all links have valid geometries
+    if integrity.invalid_geometries > 0:
+        all_passed = print_result(
+            False, f"Found {integrity.invalid_geometries} links with invalid geometries"
+        )
+    else:
+        print_result(True, "All links have valid geometries")
 
-        if len(srid_check) != 1 or srid_check[0].srid != 4326:
-            all_passed = print_result(False, "Inconsistent SRID values found")
-        else:
-            print_result(
-                True, f"All geometries use consistent SRID: {srid_check[0].srid}"
-            )
+    # Check coordinate system consistency
+    srids = integrity.srids or []
+    if len(srids) != 1 or srids[0] != 4326:
+        all_passed = print_result(False, "Inconsistent SRID values found")
+    else:
+        print_result(True, f"All geometries use consistent SRID: {srids[0]}")
 
     return all_passed
 
 
-def validate_statistical_consistency() -> bool:
+def validate_statistical_consistency(session, speed_df: pd.DataFrame) -> bool:
     """Validate statistical consistency between Parquet and database."""
     print_section("VALIDATING STATISTICAL CONSISTENCY")
 
     all_passed = True
 
-    # Load full datasets for statistical comparison
-    link_df = pd.read_parquet("/workspace/data/raw/link_info.parquet.gz")
-    speed_df = pd.read_parquet("/workspace/data/raw/duval_jan1_2024.parquet.gz")
+    # The link count comes from the footer; speed data was loaded with the samples
+    parquet_link_count = pq.ParquetFile(
+        "/workspace/data/raw/link_info.parquet.gz"
+    ).metadata.num_rows
+    parquet_speed_count = len(speed_df)
 
-    Session = get_session_factory()
+    # Fetch both record counts in a single round trip
+    db_link_count, db_speed_count = session.execute(
+        text(
+            """
+        SELECT
+            (SELECT COUNT(*) FROM links),
+            (SELECT COUNT(*) FROM speed_records)
+    """
+        )
+    ).one()
 
-    with Session() as session:
-        # Compare record counts
-        db_link_count = session.query(Link).count()
-        parquet_link_count = len(link_df)
+    # Compare record counts
+    if db_link_count != parquet_link_count:
+        all_passed = print_result(
+            False,
+            f"Link count mismatch: Parquet has {parquet_link_count}, DB has {db_link_count}",
+        )
+    else:
+        print_result(True, f"Link counts match: {db_link_count}")
 
-        if db_link_count != parquet_link_count:
-            all_passed = print_result(
-                False,
-                f"Link count mismatch: Parquet has {parquet_link_count}, DB has {db_link_count}",
+    if db_speed_count != parquet_speed_count:
+        all_passed = print_result(
+            False,
+            f"Speed record count mismatch: Parquet has {parquet_speed_count}, DB has {db_speed_count}",
+        )
+    else:
+        print_result(True, f"Speed record counts match: {db_speed_count}")
+
+    # Compare average speeds by period
+    period_mapping = {
+        1: "Overnight",
+        2: "Early Morning",
+        3: "AM Peak",
+        4: "Midday",
+        5: "Early Afternoon",
+        6: "PM Peak",
+        7: "Evening",
+    }
+
+    # All period averages in one grouped query instead of one per period
+    db_averages = dict(
+        session.execute(
+            text(
+                """
+            SELECT time_period, AVG(speed) as avg_speed
+            FROM speed_records
+            GROUP BY time_period
+        """
             )
-        else:
-            print_result(True, f"Link counts match: {db_link_count}")
+        ).all()
+    )
 
-        db_speed_count = session.query(SpeedRecord).count()
-        parquet_speed_count = len(speed_df)
+    # Parquet averages for every period in one pass
+    parquet_averages = (
+        speed_df.groupby("period", sort=False)["average_speed"].mean().to_dict()
+    )
 
-        if db_speed_count != parquet_speed_count:
+    for period_id, period_name in period_mapping.items():
+        parquet_avg = parquet_averages.get(period_id, float("nan"))
+
+        db_avg_value = db_averages.get(period_name)
+        db_avg = float(db_avg_value) if db_avg_value else 0
+
+        if abs(parquet_avg - db_avg) > 0.1:  # 0.1 mph tolerance
             all_passed = print_result(
                 False,
-                f"Speed record count mismatch: Parquet has {parquet_speed_count}, DB has {db_speed_count}",
+                f"Average speed mismatch for {period_name}: Parquet {parquet_avg:.2f}, DB {db_avg:.2f}",
             )
         else:
-            print_result(True, f"Speed record counts match: {db_speed_count}")
-
-        # Compare average speeds by period
-        period_mapping = {
-            1: "Overnight",
-            2: "Early Morning",
-            3: "AM Peak",
-            4: "Midday",
-            5: "Early Afternoon",
-            6: "PM Peak",
-            7: "Evening",
-        }
-
-        for period_id, period_name in period_mapping.items():
-            parquet_avg = speed_df[speed_df["period"] == period_id][
-                "average_speed"
-            ].mean()
-
-            db_avg_result = session.execute(
-                text(
-                    """
-                SELECT AVG(speed) as avg_speed
-                FROM speed_records
-                WHERE time_period = :period_name
-            """
-                ),
-                {"period_name": period_name},
-            ).fetchone()
-
-            db_avg = float(db_avg_result.avg_speed) if db_avg_result.avg_speed else 0
-
-            if abs(parquet_avg - db_avg) > 0.1:  # 0.1 mph tolerance
-                all_passed = print_result(
-                    False,
-                    f"Average speed mismatch for {period_name}: Parquet {parquet_avg:.2f}, DB {db_avg:.2f}",
-                )
-            else:
-                print_result(
-                    True, f"Average speed for {period_name} matches: {db_avg:.2f} mph"
-                )
+            print_result(
+                True, f"Average speed for {period_name} matches: {db_avg:.2f} mph"
+            )
 
     return all_passed
 
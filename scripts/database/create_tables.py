@@ -11,12 +11,18 @@ import sys
 # Add project root to Python path
 sys.path.insert(0, "/workspace")
 
-from sqlalchemy import text
+from sqlalchemy import inspect, text
 
 from app.core.database import Base, get_engine
 from app.models.link import Link
 from app.models.speed_record import SpeedRecord
 
+# Adds Link.length_m to links tables created before the model declared it
+LINK_LENGTH_COLUMN = f"""
+    ALTER TABLE links ADD COLUMN IF NOT EXISTS length_m double precision
+    GENERATED ALWAYS AS ({Link.__table__.c.length_m.computed.sqltext}) STORED
+"""
+
 
 def create_tables():
     """Create all tables defined in the models."""
@@ -28,8 +34,8 @@ def create_tables():
         print("Connecting to database...")
         engine = get_engine()
 
-        # Verify connection
-        with engine.connect() as conn:
+        # Connect, create and verify on a single connection and transaction
+        with engine.begin() as conn:
             result = conn.execute(text("SELECT version();"))
             row = result.fetchone()
             if row:
@@ -38,19 +44,36 @@ def create_tables():
             else:
                 print("Connected to PostgreSQL")
 
-        # Create all tables
-        print("\nCreating tables...")
-        print("   - Table 'links' (Link model)")
-        print("   - Table 'speed_records' (SpeedRecord model)")
+            # Create only the tables that do not exist yet
+            inspector = inspect(conn)
+            existing_tables = set(inspector.get_table_names())
+            missing_tables = [
+                table
+                for table in Base.metadata.sorted_tables
+                if table.name not in existing_tables
+            ]
+
+            print("\nCreating tables...")
+            for table in Base.metadata.sorted_tables:
+                status = "exists" if table.name in existing_tables else "creating"
+                print(f"   - Table '{table.name}' ({status})")
+
+            if missing_tables:
+                Base.metadata.create_all(
+                    bind=conn, tables=missing_tables, checkfirst=False
+                )
 
-        Base.metadata.create_all(bind=engine)
+            # Upgrade a links table created without the generated column
+            if "links" in existing_tables and "length_m" not in {
+                column["name"] for column in inspector.get_columns("links")
+            }:
+                print("   - Column 'links.length_m' (adding)")
+                conn.execute(text(LINK_LENGTH_COLUMN))
 
-        print("Tables created successfully!")
+            print("Tables created successfully!")
 
-        # Verify tables were created
-        print("\nVerifying created tables...")
-        with engine.connect() as conn:
-            # List tables
+            # Verify tables were created
+            print("\nVerifying created tables...")
             result = conn.execute(
                 text(
                     """
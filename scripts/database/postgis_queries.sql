@@ -18,7 +18,7 @@ SELECT
     ST_GeometryType(geometry) as geom_type,
     COUNT(*) as count,
     AVG(ST_Length(geometry)) as avg_length_degrees,
-    AVG(ST_Length(ST_Transform(geometry, 3857))) as avg_length_meters
+    AVG(length_m) as avg_length_meters
 FROM links 
 WHERE geometry IS NOT NULL
 GROUP BY ST_GeometryType(geometry);
@@ -41,7 +41,7 @@ SELECT
     link_id,
     road_name,
     ST_AsGeoJSON(geometry) as geometry_geojson,
-    ST_Length(ST_Transform(geometry, 3857)) as length_meters
+    length_m as length_meters
 FROM links 
 WHERE geometry IS NOT NULL 
 LIMIT 3;
@@ -85,7 +85,7 @@ SELECT
     ST_AsText(geometry) as wkt,
     ST_AsGeoJSON(geometry, 6) as geojson,  -- 6 decimal places
     ST_Length(geometry) as length_degrees,
-    ST_Length(ST_Transform(geometry, 3857)) as length_meters,
+    length_m as length_meters,
     ST_NumPoints(geometry) as point_count,
     ST_X(ST_Centroid(geometry)) as center_lon,
     ST_Y(ST_Centroid(geometry)) as center_lat
@@ -117,9 +117,8 @@ SELECT
     MIN(s.timestamp) as first_measurement,
     MAX(s.timestamp) as last_measurement
 FROM links l
-LEFT JOIN speed_records s ON l.link_id = s.link_id
+JOIN speed_records s ON l.link_id = s.link_id
 WHERE l.geometry IS NOT NULL
-GROUP BY l.link_id, l.road_name, l.geometry
-HAVING COUNT(s.id) > 0
+GROUP BY l.link_id  -- Primary key; the other link columns depend on it
 ORDER BY avg_speed DESC
 LIMIT 5;
@@ -38,16 +38,23 @@ def check_database_state():
     Session = get_session_factory()
 
     with Session() as session:
-        # Basic counts
-        link_count = session.query(Link).count()
-        speed_count = session.query(SpeedRecord).count()
+        # Basic counts, fetched in a single round trip
+        link_count, speed_count, links_with_geom = session.execute(
+            text(
+                """
+            SELECT
+                (SELECT COUNT(*) FROM links),
+                (SELECT COUNT(*) FROM speed_records),
+                (SELECT COUNT(*) FROM links WHERE geometry IS NOT NULL)
+        """
+            )
+        ).one()
 
         print(f"Links in database: {link_count:,}")
         print(f"Speed records in database: {speed_count:,}")
 
         # Check geometry data specifically
         print(f"\nGEOMETRY VERIFICATION:")
-        links_with_geom = session.query(Link).filter(Link.geometry.isnot(None)).count()
         print(f"  Links with geometry: {links_with_geom:,}")
 
         if links_with_geom > 0:
@@ -124,9 +131,19 @@ def check_database_state():
                 valid_geometries = result[0]
                 print(f"  Valid geometries: {valid_geometries:,}")
 
-            # Test bounding box calculation
+            # Test bounding box calculation. The estimate reads planner
+            # statistics only; scan the table only when none exist yet.
             result = session.execute(
-                text("SELECT ST_AsText(ST_Extent(geometry)) as bbox FROM links LIMIT 1")
+                text(
+                    """
+                SELECT ST_AsText(
+                    COALESCE(
+                        ST_EstimatedExtent('public', 'links', 'geometry')::geometry,
+                        (SELECT ST_Extent(geometry) FROM links)::geometry
+                    )
+                ) as bbox
+            """
+                )
             ).fetchone()
             if result and result.bbox:
                 print(f"  Data extent: {result.bbox}")
@@ -4,23 +4,34 @@ PostGIS Geometry Verification Script
 
 This script demonstrates how to properly query and display PostGIS geometry data
 using various PostGIS functions for spatial analysis.
+
+Run with --explain to also check every query's EXPLAIN ANALYZE plan against
+the limits below; the script exits with status 1 if any plan exceeds them.
 """
 
 import sys
 
 sys.path.insert(0, "/workspace")
 
-import json
+import numpy as np
+import orjson
+import shapely
+from shapely.geometry import mapping
 
-from sqlalchemy import text
+from app.core.database import get_engine
 
-from app.core.database import get_session_factory
+# --explain limits, checked against EXPLAIN ANALYZE for every query
+EXPLAIN_MAX_TIME_MS = 2000.0
+EXPLAIN_MAX_ROWS_REMOVED = 10_000
 
 
 def main():
     """Main verification function."""
+    # Hand-parsed: a single optional flag does not need argparse
+    explain = "--explain" in sys.argv[1:]
+
     try:
-        verify_postgis_geometries()
+        plan_problems = verify_postgis_geometries(explain=explain)
 
         print_section("VERIFICATION COMPLETED")
         print("\nTo connect to PostgreSQL directly with psql:")
@@ -31,6 +42,10 @@ def main():
         )
         print("\nPassword: geoapi_password")
 
+        if plan_problems:
+            print(f"\n{len(plan_problems)} query plan check(s) failed")
+            sys.exit(1)
+
     except Exception as e:
         print(f"Error during verification: {e}")
         import traceback
@@ -45,86 +60,261 @@ def print_section(title):
     print("=" * 80)
 
 
-def execute_query(session, query, description):
-    """Execute a query and display results."""
+def run_query(cursor, query, plan_problems=None):
+    """
+    Execute a query, checking its plan first when plan_problems is a list.
+
+    Args:
+        cursor: DB-API cursor
+        query: SQL text
+        plan_problems: List collecting plan check failures, or None to skip
+    """
+    if plan_problems is not None:
+        plan_problems.extend(check_query_plan(cursor, query))
+    cursor.execute(query)
+
+
+def check_query_plan(cursor, query):
+    """
+    Run EXPLAIN ANALYZE on a query and report plans that exceed the limits.
+
+    A plan fails when it runs longer than EXPLAIN_MAX_TIME_MS or contains a
+    sequential scan on links that filters out more than
+    EXPLAIN_MAX_ROWS_REMOVED rows, the sign of a missing or unused index.
+
+    Args:
+        cursor: DB-API cursor
+        query: SQL text
+
+    Returns:
+        list: Description of each exceeded limit
+    """
+    cursor.execute(
+        "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + query.strip().rstrip(";")
+    )
+    plan = cursor.fetchone()[0][0]
+
+    problems = []
+    execution_time = plan["Execution Time"]
+    if execution_time > EXPLAIN_MAX_TIME_MS:
+        problems.append(
+            f"ran {execution_time:.1f} ms (limit {EXPLAIN_MAX_TIME_MS:.0f} ms)"
+        )
+
+    nodes = [plan["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        nodes.extend(node.get("Plans", []))
+        removed = node.get("Rows Removed by Filter", 0)
+        if (
+            node["Node Type"] == "Seq Scan"
+            and node.get("Relation Name") == "links"
+            and removed > EXPLAIN_MAX_ROWS_REMOVED
+        ):
+            problems.append(f"sequential scan on links filtered out {removed:,} rows")
+
+    for problem in problems:
+        print(f"[PLAN FAIL] {problem}")
+    if not problems:
+        print(f"[PLAN OK] {execution_time:.1f} ms")
+
+    return problems
+
+
+def execute_query(cursor, query, description, plan_problems=None):
+    """Execute a query on a DB-API cursor and display results."""
     print(f"\n{description}")
     print("-" * 60)
 
     try:
-        result = session.execute(text(query))
-        rows = result.fetchall()
-
-        if not rows:
-            print("No results returned.")
-            return
-
-        # Print column headers
-        if hasattr(result, "keys"):
-            headers = result.keys()
-            print(" | ".join(f"{header:<20}" for header in headers))
-            print("-" * (22 * len(headers)))
-
-        # Print rows
-        for row in rows:
-            values = []
-            for value in row:
-                if isinstance(value, str) and len(value) > 50:
-                    # Truncate long strings (like WKT)
-                    values.append(value[:47] + "...")
-                elif isinstance(value, float):
-                    values.append(f"{value:.6f}")
-                else:
-                    values.append(str(value))
-            print(" | ".join(f"{value:<20}" for value in values))
+        run_query(cursor, query, plan_problems)
+        rows = cursor.fetchall()
+        headers = [column[0] for column in cursor.description]
+        print_rows(headers, rows)
 
     except Exception as e:
+        # Clear the aborted transaction so the next query can run
+        cursor.connection.rollback()
         print(f"Error executing query: {e}")
 
 
-def verify_postgis_geometries():
-    """Verify PostGIS geometry data with comprehensive queries."""
+def print_rows(headers, rows):
+    """Display result rows as a table under their column headers."""
+    if not rows:
+        print("No results returned.")
+        return
 
-    print_section("POSTGIS GEOMETRY VERIFICATION")
+    # Print column headers
+    print(" | ".join(f"{header:<20}" for header in headers))
+    print("-" * (22 * len(headers)))
 
-    Session = get_session_factory()
+    # Pick each column's formatter once instead of type-checking every cell
+    formatters = [column_formatter(column) for column in zip(*rows)]
 
-    with Session() as session:
+    # Print rows
+    for row in rows:
+        print(
+            " | ".join(
+                f"{format_value(value):<20}"
+                for format_value, value in zip(formatters, row)
+            )
+        )
 
-        # 1. Basic PostGIS information
-        execute_query(session, "SELECT PostGIS_version();", "1. PostGIS Version Check")
 
-        # 2. Geometry summary
-        execute_query(
-            session,
+def format_float(value):
+    """Format a float column value with six decimals."""
+    return "None" if value is None else f"{value:.6f}"
+
+
+def format_text(value):
+    """Format a text column value, truncating long strings (like WKT)."""
+    if value is None or len(value) <= 50:
+        return str(value)
+    return value[:47] + "..."
+
+
+def column_formatter(values):
+    """Return the formatter for a column based on its first non-NULL value."""
+    sample = next((value for value in values if value is not None), None)
+    if isinstance(sample, float):
+        return format_float
+    if isinstance(sample, str):
+        return format_text
+    return str
+
+
+def print_summary(summary, grouping_set, headers, description):
+    """
+    Display one grouping set of the link summary.
+
+    Args:
+        summary: Rows from fetch_link_summary, as dicts
+        grouping_set: GROUPING() value selecting the rows to show
+        headers: Columns to display
+        description: Section title
+    """
+    print(f"\n{description}")
+    print("-" * 60)
+
+    rows = [
+        [row[header] for header in headers]
+        for row in summary
+        if row["grouping_set"] == grouping_set
+    ]
+    print_rows(headers, rows)
+
+
+def fetch_link_summary(cursor, plan_problems=None):
+    """
+    Compute the links summary, type, extent and SRID statistics in one scan.
+
+    Grouping sets aggregate the whole table (grouping_set 3), each geometry
+    type (1) and each SRID (2) in a single pass over links. Per-type and
+    per-SRID rows for NULL geometries are left out, as in the separate
+    queries this replaces.
+
+    Args:
+        cursor: DB-API cursor
+        plan_problems: List collecting plan check failures, or None to skip
+
+    Returns:
+        list: One dict per result row
+    """
+    try:
+        run_query(
+            cursor,
             """
-            SELECT 
+            SELECT
+                GROUPING(geom_type, srid) as grouping_set,
+                geom_type,
+                srid,
                 COUNT(*) as total_links,
                 COUNT(geometry) as links_with_geometry,
-                COUNT(CASE WHEN ST_IsValid(geometry) THEN 1 END) as valid_geometries
-            FROM links;
+                COUNT(CASE WHEN ST_IsValid(geometry) THEN 1 END) as valid_geometries,
+                COUNT(*) as count,
+                ROUND(AVG(ST_Length(geometry))::numeric, 8) as avg_length_degrees,
+                ROUND(AVG(length_m)::numeric, 2) as avg_length_meters,
+                ST_AsText(ST_Extent(geometry)) as data_extent
+            FROM (
+                SELECT
+                    geometry,
+                    length_m,
+                    ST_GeometryType(geometry) as geom_type,
+                    ST_SRID(geometry) as srid
+                FROM links
+            ) l
+            GROUP BY GROUPING SETS ((), (geom_type), (srid));
         """,
+            plan_problems,
+        )
+        headers = [column[0] for column in cursor.description]
+        rows = [dict(zip(headers, row)) for row in cursor.fetchall()]
+
+    except Exception as e:
+        cursor.connection.rollback()
+        print(f"\nError computing link summary: {e}")
+        return []
+
+    return [
+        row
+        for row in rows
+        if row["grouping_set"] == 3
+        or (row["grouping_set"] == 1 and row["geom_type"] is not None)
+        or (row["grouping_set"] == 2 and row["srid"] is not None)
+    ]
+
+
+def verify_postgis_geometries(explain=False):
+    """
+    Verify PostGIS geometry data with comprehensive queries.
+
+    Args:
+        explain: Also check every query's EXPLAIN ANALYZE plan
+
+    Returns:
+        list: Plan check failures (always empty unless explain is set)
+    """
+    plan_problems = [] if explain else None
+
+    print_section("POSTGIS GEOMETRY VERIFICATION")
+
+    # None of these queries need the ORM, so they run on a plain DB-API
+    # cursor and skip SQLAlchemy's result processing
+    connection = get_engine().raw_connection()
+
+    try:
+        cursor = connection.cursor()
+
+        # 1. Basic PostGIS information
+        execute_query(
+            cursor,
+            "SELECT PostGIS_version();",
+            "1. PostGIS Version Check",
+            plan_problems,
+        )
+
+        # 2, 3, 6 and 7 share one scan of links
+        summary = fetch_link_summary(cursor, plan_problems)
+
+        # 2. Geometry summary
+        print_summary(
+            summary,
+            3,
+            ["total_links", "links_with_geometry", "valid_geometries"],
             "2. Geometry Summary",
         )
 
         # 3. Geometry types
-        execute_query(
-            session,
-            """
-            SELECT 
-                ST_GeometryType(geometry) as geom_type,
-                COUNT(*) as count,
-                ROUND(AVG(ST_Length(geometry))::numeric, 8) as avg_length_degrees,
-                ROUND(AVG(ST_Length(ST_Transform(geometry, 3857)))::numeric, 2) as avg_length_meters
-            FROM links 
-            WHERE geometry IS NOT NULL
-            GROUP BY ST_GeometryType(geometry);
-        """,
+        print_summary(
+            summary,
+            1,
+            ["geom_type", "count", "avg_length_degrees", "avg_length_meters"],
             "3. Geometry Types and Statistics",
         )
 
         # 4. Sample geometries as WKT
         execute_query(
-            session,
+            cursor,
             """
             SELECT 
                 link_id,
@@ -137,69 +327,60 @@ def verify_postgis_geometries():
             LIMIT 3;
         """,
             "4. Sample Geometries (WKT Format)",
+            plan_problems,
         )
 
         # 5. Sample geometries as GeoJSON (more readable)
         print("\n5. Sample Geometries (GeoJSON Format)")
         print("-" * 60)
         try:
-            result = session.execute(
-                text(
-                    """
+            run_query(
+                cursor,
+                """
                 SELECT 
                     link_id,
                     road_name,
-                    ST_AsGeoJSON(geometry, 6) as geometry_geojson,
-                    ROUND(ST_Length(ST_Transform(geometry, 3857))::numeric, 2) as length_meters
+                    geometry::bytea as geometry_wkb,
+                    ROUND(length_m::numeric, 2) as length_meters
                 FROM links 
                 WHERE geometry IS NOT NULL 
                 ORDER BY link_id
                 LIMIT 3;
-            """
-                )
+            """,
+                plan_problems,
             )
 
-            for row in result:
-                print(f"\nLink ID: {row.link_id}")
-                print(f"Road Name: {row.road_name}")
-                print(f"Length (meters): {row.length_meters}")
+            for link_id, road_name, geometry_wkb, length_meters in cursor:
+                print(f"\nLink ID: {link_id}")
+                print(f"Road Name: {road_name}")
+                print(f"Length (meters): {length_meters}")
+
+                # Build the GeoJSON from EWKB client-side, rounded to 6
+                # decimals like ST_AsGeoJSON(geometry, 6)
+                geometry = shapely.transform(
+                    shapely.from_wkb(bytes(geometry_wkb)),
+                    lambda coordinates: np.round(coordinates, 6),
+                )
+                geojson = mapping(geometry)
 
                 # Pretty print the GeoJSON
-                geojson = json.loads(row.geometry_geojson)
-                print(f"GeoJSON: {json.dumps(geojson, indent=2)}")
+                pretty = orjson.dumps(geojson, option=orjson.OPT_INDENT_2).decode()
+                print(f"GeoJSON: {pretty}")
                 print("-" * 40)
 
         except Exception as e:
+            connection.rollback()
             print(f"Error displaying GeoJSON: {e}")
 
         # 6. Data extent
-        execute_query(
-            session,
-            """
-            SELECT 
-                ST_AsText(ST_Extent(geometry)) as data_extent
-            FROM links;
-        """,
-            "6. Geographic Extent of Data",
-        )
+        print_summary(summary, 3, ["data_extent"], "6. Geographic Extent of Data")
 
         # 7. Coordinate system
-        execute_query(
-            session,
-            """
-            SELECT DISTINCT 
-                ST_SRID(geometry) as srid,
-                COUNT(*) as count
-            FROM links 
-            WHERE geometry IS NOT NULL
-            GROUP BY ST_SRID(geometry);
-        """,
-            "7. Coordinate Reference Systems",
-        )
+        print_summary(summary, 2, ["srid", "count"], "7. Coordinate Reference Systems")
 
         # 8. Sample coordinate points
         execute_query(
-            session,
+            cursor,
             """
             SELECT 
                 link_id,
@@ -215,29 +396,35 @@ def verify_postgis_geometries():
             LIMIT 5;
         """,
             "8. Sample Start/End Coordinates",
+            plan_problems,
         )
 
         # 9. Links with speed data
         execute_query(
-            session,
+            cursor,
             """
             SELECT 
                 l.link_id,
                 l.road_name,
                 COUNT(s.id) as speed_records,
                 ROUND(AVG(s.speed)::numeric, 2) as avg_speed_mph,
-                ROUND(ST_Length(ST_Transform(l.geometry, 3857))::numeric, 2) as length_meters
+                ROUND(l.length_m::numeric, 2) as length_meters
             FROM links l
-            LEFT JOIN speed_records s ON l.link_id = s.link_id
+            JOIN speed_records s ON l.link_id = s.link_id
             WHERE l.geometry IS NOT NULL
-            GROUP BY l.link_id, l.road_name, l.geometry
-            HAVING COUNT(s.id) > 0
+            GROUP BY l.link_id
             ORDER BY avg_speed_mph DESC
             LIMIT 5;
         """,
             "9. Links with Speed Data (Top 5 by Average Speed)",
+            plan_problems,
         )
 
+    finally:
+        connection.close()
+
+    return plan_problems or []
+
 
 if __name__ == "__main__":
     main()
@@ -7,13 +7,30 @@ validation, serialization, and common patterns.
 """
 import json
 import sys
+from operator import attrgetter
 
 sys.path.insert(0, "/workspace")
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from app.schemas.link import LinkBase, LinkCreate, LinkList, LinkResponse
 
+# Built once: validates or serializes a whole page in a single pydantic-core call
+LINK_LIST_ADAPTER = TypeAdapter(list[LinkResponse])
+
+# Field names read from trusted ORM rows when skipping validation
+LINK_RESPONSE_FIELDS = tuple(LinkResponse.model_fields)
+
+# Fetches every field of a row in one call, in LINK_RESPONSE_FIELDS order
+_GET_LINK_RESPONSE_FIELDS = attrgetter(*LINK_RESPONSE_FIELDS)
+
+
+def to_response(db_link):
+    """Build a LinkResponse from a trusted ORM row without validation."""
+    return LinkResponse.model_construct(
+        **dict(zip(LINK_RESPONSE_FIELDS, _GET_LINK_RESPONSE_FIELDS(db_link)))
+    )
+
 
 def demo_schema_basics():
     """Demonstrate basic schema concepts."""
@@ -132,6 +149,19 @@ def demo_sqlalchemy_integration():
     print(f"   Schema: {link_response}")
     print(f"   JSON: {link_response.model_dump_json()}")
 
+    # Trusted rows: the ORM column types already guarantee the field types
+    print("\n3. Trusted Conversion (no validation):")
+    print("to_response(mock_db_record)")
+    trusted_response = to_response(mock_db_record)
+    print(f"   Schema: {trusted_response}")
+    print("   Endpoints keep response_model, which validates the returned value")
+
+    # Bulk conversion: construct for trusted rows, LINK_LIST_ADAPTER otherwise
+    print("\n4. Bulk Trusted Conversion:")
+    print("list(map(to_response, db_links))")
+    trusted_links = list(map(to_response, [mock_db_record, MockSQLAlchemyLink()]))
+    print(f"   Converted {len(trusted_links)} rows")
+
 
 def demo_api_usage():
     """Demonstrate API usage patterns."""
@@ -167,14 +197,17 @@ def demo_api_usage():
     )
     print(f"   Schema response: {response_data}")
     print(f"   JSON to client: {response_data.model_dump_json()}")
+    print("   The app serializes responses with ORJSONResponse (default class)")
 
     print("\n3. Paginated List:")
-    # List with multiple items
-    links = [
-        LinkResponse(link_id=1, road_name="Road 1"),
-        LinkResponse(link_id=2, road_name="Road 2"),
-        LinkResponse(link_id=3, road_name="Road 3"),
-    ]
+    # List with multiple items, validated as one batch
+    print("LINK_LIST_ADAPTER.validate_python(rows)")
+    rows = [{"link_id": i, "road_name": f"Road {i}"} for i in range(1, 4)]
+    links = LINK_LIST_ADAPTER.validate_python(rows)
+
+    # The same adapter serializes the whole page in one call
+    print("LINK_LIST_ADAPTER.dump_json(links)")
+    print(f"   JSON: {LINK_LIST_ADAPTER.dump_json(links).decode()[:80]}...")
 
     link_list = LinkList(items=links, total=150, page=1, size=3, pages=50)
     print(f"   List: {len(link_list.items)} items")
@@ -7,8 +7,10 @@ how Pydantic schemas work, including validation, serialization, and
 integration with FastAPI and SQLAlchemy.
 """
 
+import io
 import json
 import sys
+from contextlib import redirect_stdout
 from datetime import datetime
 from typing import Any, Dict
 
@@ -167,10 +169,8 @@ def demo_geospatial_features():
     print(f"   Road: {link_with_geometry.road_name}")
     print(f"   Link ID: {link_with_geometry.link_id}")
     if link_with_geometry.geometry:
-        print(f"   Geometry type: {link_with_geometry.geometry['type']}")
-        print(
-            f"   Coordinates: {len(link_with_geometry.geometry['coordinates'])} points"
-        )
+        print(f"   Geometry type: {link_with_geometry.geometry.type}")
+        print(f"   Coordinates: {len(link_with_geometry.geometry.coordinates)} points")
 
     # 2. Geometry validation
     print("\n2. GEOMETRY VALIDATION:")
@@ -256,8 +256,8 @@ def demo_json_serialization():
     print(json.dumps(dict_without_timestamps, indent=2, default=str))
 
 
-def interactive_demo():
-    """Run the complete interactive demonstration."""
+def _print_demo():
+    """Print every section of the demonstration."""
     print(
         """
 ╔══════════════════════════════════════════════════════════════════════════════╗
@@ -329,6 +329,23 @@ The schemas in this project provide:
     print("- View API docs: http://localhost:8000/docs")
 
 
+def interactive_demo():
+    """
+    Run the complete interactive demonstration.
+
+    The demo prints a few hundred lines; they are collected in memory and
+    written to stdout in a single call instead of one write per print().
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            _print_demo()
+    finally:
+        # Emit whatever was produced, even if a section raised
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
 if __name__ == "__main__":
     try:
         interactive_demo()
@@ -6,9 +6,12 @@ Quick verification that all components are working correctly.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-import requests
+import httpx
+
+API_URL = "http://localhost:8000"
 
 
 def main():
@@ -26,16 +29,18 @@ def main():
 
     all_passed = True
 
-    for check_name, check_func in checks:
-        print(f"Checking {check_name}...")
-        if not check_func():
-            all_passed = False
-        print()
+    # One keep-alive client shared by every check, so connections are reused
+    with httpx.Client(base_url=API_URL, timeout=5, follow_redirects=True) as client:
+        for check_name, check_func in checks:
+            print(f"Checking {check_name}...")
+            if not check_func(client):
+                all_passed = False
+            print()
 
     if all_passed:
         print("ALL CHECKS PASSED!")
         print("\nAPI is ready for testing!")
-        print("Visit: http://localhost:8000/docs")
+        print(f"Visit: {API_URL}/docs")
         sys.exit(0)
     else:
         print("SOME CHECKS FAILED!")
@@ -46,59 +51,73 @@ def main():
         sys.exit(1)
 
 
-def check_api_health():
+def check_api_health(client):
     """Check if API is responding."""
     try:
-        response = requests.get("http://localhost:8000/health", timeout=5)
+        response = client.get("/health")
         if response.status_code == 200:
             data = response.json()
             print("API Health: OK")
             print(f"  Database: {data.get('database', 'Unknown')}")
             print(f"  Timestamp: {data.get('timestamp', 'Unknown')}")
             return True
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"API Health: FAILED - {e}")
     return False
 
 
-def check_api_docs():
+def check_api_docs(client):
     """Check if API documentation is accessible."""
     try:
-        response = requests.get("http://localhost:8000/docs", timeout=5)
+        response = client.get("/docs")
         if response.status_code == 200:
             print("API Documentation: OK")
             return True
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"API Documentation: FAILED - {e}")
     return False
 
 
-def check_endpoints():
+def check_endpoints(client):
     """Check main API endpoints."""
     endpoints = [
-        ("GET /", "http://localhost:8000/"),
-        ("GET /links/", "http://localhost:8000/links/"),
-        ("GET /aggregates/summary/", "http://localhost:8000/aggregates/summary/"),
+        ("GET /", "/"),
+        ("GET /links/", "/links/"),
+        ("GET /aggregates/summary/", "/aggregates/summary/"),
     ]
 
     all_ok = True
 
-    for name, url in endpoints:
-        try:
-            # Use longer timeout for data endpoints
-            timeout = 10 if "aggregates" in url else 5
-            response = requests.get(url, timeout=timeout)
-            if 200 <= response.status_code < 300:
-                print(f"{name}: OK ({response.status_code})")
+    # The requests are independent, so they run concurrently on the client
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        futures = [
+            executor.submit(get_status_code, client, path) for _, path in endpoints
+        ]
+        # Results are reported in the order the endpoints are listed
+        for (name, _), future in zip(endpoints, futures):
+            try:
+                status_code = future.result()
+            except httpx.HTTPError as e:
+                print(f"{name}: FAILED - {e}")
+                all_ok = False
+                continue
+            if 200 <= status_code < 300:
+                print(f"{name}: OK ({status_code})")
             else:
-                print(f"{name}: FAILED ({response.status_code})")
+                print(f"{name}: FAILED ({status_code})")
                 all_ok = False
-        except requests.RequestException as e:
-            print(f"{name}: FAILED - {e}")
-            all_ok = False
 
     return all_ok
 
 
+def get_status_code(client, path):
+    """Return the status code of a GET request to an endpoint."""
+    # Use longer timeout for data endpoints
+    timeout = 10 if "aggregates" in path else 5
+    # Only the status is checked, so the body is never downloaded
+    with client.stream("GET", path, timeout=timeout) as response:
+        return response.status_code
+
+
 if __name__ == "__main__":
     main()
@@ -6,13 +6,28 @@ Provides options to run different test suites:
 - SQLite-compatible tests (no PostGIS dependency)
 - Full PostgreSQL/PostGIS tests
 - All tests
+
+--sqlite selects tests with pytest-testmon. To check the selection, run
+--sqlite --fresh, then --sqlite again without changing any code: the second
+run should report "no tests ran" with every test deselected.
 """
-import argparse
+
 import os
 import shutil
 import subprocess
 import sys
 
+# pytest-testmon dependency database (kept between runs)
+TESTMON_DATA = "/workspace/.testmondata"
+
+USAGE = """usage: run_tests.py (--sqlite | --all | --help-tests) [--fresh]
+
+  --sqlite      Run SQLite-compatible tests only
+  --all         Run all tests (requires PostgreSQL/PostGIS)
+  --help-tests  Show detailed help about test categories
+  --fresh       Delete testmon data before running so every test executes
+"""
+
 
 def clean_pycache():
     """Clean Python cache files to avoid import conflicts."""
@@ -46,6 +61,13 @@ def clean_pycache():
     print("-" * 50)
 
 
+def reset_testmon_data():
+    """Delete the testmon database so the next run executes every test."""
+    if os.path.exists(TESTMON_DATA):
+        print(f"Removing {TESTMON_DATA}")
+        os.remove(TESTMON_DATA)
+
+
 def run_sqlite_tests():
     """Execute only tests that work with SQLite."""
 
@@ -67,10 +89,23 @@ def run_sqlite_tests():
     # Clean Python cache before running tests
     clean_pycache()
 
-    cmd = ["python", "-m", "pytest", "-v", "--tb=short"] + working_tests
+    # Only re-run tests whose covered code changed since the last run.
+    # testmon turns itself off under pytest-xdist and conflicts with
+    # pytest-cov, so this run is serial and skips the coverage addopts.
+    cmd = [
+        "python",
+        "-m",
+        "pytest",
+        "--testmon",
+        "--no-cov",
+        "--tb=short",
+    ] + working_tests
+
+    # Skip writing .pyc files that clean_pycache removes again on the next run
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
 
     try:
-        result = subprocess.run(cmd, check=True, cwd="/workspace")
+        result = subprocess.run(cmd, check=True, cwd="/workspace", env=env)
         print(f"\nAll SQLite tests passed! (exit code: {result.returncode})")
         return True
     except subprocess.CalledProcessError as e:
@@ -87,7 +122,18 @@ def run_full_tests():
     # Clean Python cache before running tests
     clean_pycache()
 
-    cmd = ["python", "-m", "pytest", "-v", "--tb=short", "tests/"]
+    # Independent tests: spread them across all cores with pytest-xdist.
+    # -v is dropped because per-test lines from parallel workers interleave.
+    cmd = [
+        "python",
+        "-m",
+        "pytest",
+        "-n",
+        "auto",
+        "--dist=loadfile",
+        "--tb=short",
+        "tests/",
+    ]
 
     try:
         result = subprocess.run(cmd, check=True, cwd="/workspace")
@@ -122,49 +168,47 @@ def show_test_help():
     print("--help-tests:")
     print("  Shows this help message")
     print()
+    print("--fresh:")
+    print("  Deletes .testmondata first so no tests are deselected")
+    print()
     print("Features:")
     print("  - Automatic Python cache cleaning before tests")
-    print("  - Test coverage reporting")
+    print("  - Test coverage reporting (--all)")
     print("  - SQLite mode for quick testing without PostgreSQL")
+    print("  - --sqlite re-runs only tests affected by code changes (pytest-testmon)")
+    print("  - --all runs tests in parallel across all cores (pytest-xdist)")
     print()
     print("Examples:")
     print("  python scripts/testing/run_tests.py --sqlite")
+    print("  python scripts/testing/run_tests.py --sqlite --fresh")
     print("  python scripts/testing/run_tests.py --all")
 
 
 def main():
     """Main test runner entry point."""
-    parser = argparse.ArgumentParser(
-        description="GeoAPI Test Runner",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-
-    group = parser.add_mutually_exclusive_group(required=True)
-    group.add_argument(
-        "--sqlite", action="store_true", help="Run SQLite-compatible tests only"
-    )
-    group.add_argument(
-        "--all", action="store_true", help="Run all tests (requires PostgreSQL/PostGIS)"
-    )
-    group.add_argument(
-        "--help-tests",
-        action="store_true",
-        help="Show detailed help about test categories",
-    )
-
-    args = parser.parse_args()
-
-    if args.help_tests:
+    # Hand-parsed: three literal modes plus one flag do not need argparse
+    args = sys.argv[1:]
+    fresh = "--fresh" in args
+    modes = [arg for arg in args if arg != "--fresh"]
+    mode = modes[0] if len(modes) == 1 else ""
+
+    if mode in ("--help-tests", "-h", "--help"):
         show_test_help()
         return
 
+    if mode not in ("--sqlite", "--all"):
+        print(USAGE, file=sys.stderr)
+        sys.exit(2)
+
     print("GeoAPI Test Runner")
     print("=" * 50)
 
-    success = False  # Initialize success variable
-    if args.sqlite:
+    if fresh:
+        reset_testmon_data()
+
+    if mode == "--sqlite":
         success = run_sqlite_tests()
-    elif args.all:
+    else:
         success = run_full_tests()
 
     print("\n" + "=" * 50)
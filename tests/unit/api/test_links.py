@@ -0,0 +1,52 @@
+"""
+Tests for the link endpoints.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from starlette.testclient import TestClient
+
+from app.core.database import get_db
+from app.main import app
+
+
+class TestCreateLinkValidation:
+    """Tests for geometry validation on POST /links/."""
+
+    @pytest.fixture
+    def db(self):
+        """Replace the database session with a mock."""
+        session = MagicMock()
+        app.dependency_overrides[get_db] = lambda: session
+        yield session
+        app.dependency_overrides.clear()
+
+    @pytest.fixture
+    def client(self, db):
+        """Create a TestClient for the app."""
+        return TestClient(app)
+
+    @pytest.mark.parametrize(
+        "geometry",
+        [
+            {"type": "Point", "coordinates": [-81.3792, 30.3322]},
+            {
+                "type": "MultiLineString",
+                "coordinates": [[[-81.3792, 30.3322], [-81.3791, 30.3325]]],
+            },
+            {
+                "type": "Polygon",
+                "coordinates": [
+                    [[-81.5, 30.1], [-81.6, 30.1], [-81.6, 30.2], [-81.5, 30.1]]
+                ],
+            },
+        ],
+    )
+    def test_non_line_string_rejected(self, client, db, geometry):
+        """Test geometries the links table cannot store are rejected with 422."""
+        response = client.post("/links/", json={"link_id": 1, "geometry": geometry})
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "union_tag_invalid"
+        db.add.assert_not_called()
@@ -71,6 +71,7 @@ class TestDatabaseEngineConfiguration:
                     "check_same_thread": False,
                     "timeout": 30,
                 }
+                assert "executemany_mode" not in kwargs
 
     def test_postgresql_connect_args(self):
         """Test PostgreSQL connection arguments."""
@@ -96,6 +97,9 @@ class TestDatabaseEngineConfiguration:
                     "connect_timeout": 10,
                     "application_name": "geoapi",
                 }
+                assert kwargs["executemany_mode"] == "values_plus_batch"
+                assert kwargs["insertmanyvalues_page_size"] == 1000
+                assert kwargs["executemany_batch_page_size"] == 1000
 
 
 class TestPostgisIntegration:
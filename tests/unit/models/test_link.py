@@ -38,7 +38,7 @@ class TestLinkModelStructure:
         table_args = Link.__table_args__
 
         # Check that indexes are defined
-        assert len(table_args) == 2
+        assert len(table_args) == 3
 
         # Check that the spatial index for geometry is defined
         geometry_index = table_args[0]
@@ -50,6 +50,12 @@ class TestLinkModelStructure:
         assert road_name_index.name == "idx_link_road_name"
         assert "road_name" in str(road_name_index)
 
+        # Check that the partial index for invalid geometries is defined
+        invalid_geometry_index = table_args[2]
+        assert invalid_geometry_index.name == "idx_link_invalid_geometry"
+        where = invalid_geometry_index.dialect_options["postgresql"]["where"]
+        assert "ST_IsValid(geometry)" in str(where)
+
     def test_link_column_metadata(self):
         """Test Link column metadata and comments."""
         # Test that column comments are properly defined
@@ -60,6 +66,14 @@ class TestLinkModelStructure:
         assert Link.road_type.comment == "Type or classification of road"
         assert Link.speed_limit.comment == "Speed limit in mph"
 
+    def test_link_length_m_generated(self):
+        """Test length_m is a stored column generated from the geometry."""
+        computed = Link.__table__.c.length_m.computed
+
+        assert computed is not None
+        assert computed.persisted is True
+        assert "ST_Transform(geometry, 3857)" in str(computed.sqltext)
+
     def test_link_relationship_metadata(self):
         """Test Link relationship metadata."""
         # Verificar que o relacionamento com speed_records está definido corretamente
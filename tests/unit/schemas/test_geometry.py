@@ -0,0 +1,209 @@
+"""
+Tests for GeoJSON geometry schemas.
+"""
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from app.schemas.geometry import (
+    GEOMETRY_SAMPLE_SIZE,
+    MAX_VALIDATED_COORDINATES,
+    Geometry,
+    LineString,
+    MultiLineString,
+    Point,
+    Polygon,
+    SampledGeometry,
+    count_positions,
+    is_position_list,
+)
+
+geometry_adapter = TypeAdapter(Geometry)
+
+
+class TestGeometrySchemas:
+    """Test GeoJSON geometry schemas."""
+
+    @pytest.mark.parametrize(
+        "geometry_data,expected_class",
+        [
+            ({"type": "Point", "coordinates": [-81.5, 30.1]}, Point),
+            (
+                {"type": "LineString", "coordinates": [[-81.5, 30.1], [-81.6, 30.2]]},
+                LineString,
+            ),
+            (
+                {
+                    "type": "MultiLineString",
+                    "coordinates": [[[-81.51023, 30.16599], [-81.51038, 30.16637]]],
+                },
+                MultiLineString,
+            ),
+            (
+                {
+                    "type": "Polygon",
+                    "coordinates": [
+                        [[-81.5, 30.1], [-81.6, 30.1], [-81.6, 30.2], [-81.5, 30.1]]
+                    ],
+                },
+                Polygon,
+            ),
+        ],
+    )
+    def test_dispatch_on_type(self, geometry_data, expected_class):
+        """Test each geometry type is validated by its own schema."""
+        geometry = geometry_adapter.validate_python(geometry_data)
+
+        assert isinstance(geometry, expected_class)
+        assert geometry.model_dump(mode="json") == geometry_data
+
+    def test_json_round_trip(self):
+        """Test parsing a GeoJSON string as stored in the source data."""
+        geo_json = (
+            '{"type":"MultiLineString",'
+            '"coordinates":[[[-81.63549,30.35749],[-81.63516,30.35749]]]}'
+        )
+
+        geometry = geometry_adapter.validate_json(geo_json)
+
+        assert isinstance(geometry, MultiLineString)
+        assert geometry.coordinates[0][1] == (-81.63516, 30.35749)
+
+    def test_missing_type(self):
+        """Test geometry without a type tag is rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            geometry_adapter.validate_python({"coordinates": [-81.5, 30.1]})
+
+        assert exc_info.value.errors()[0]["type"] == "union_tag_not_found"
+
+    def test_position_with_elevation(self):
+        """Test positions accept an optional third (elevation) value."""
+        geometry = geometry_adapter.validate_python(
+            {"type": "Point", "coordinates": [-81.5, 30.1, 12.0]}
+        )
+
+        assert geometry.coordinates == (-81.5, 30.1, 12.0)
+
+    def test_position_must_have_two_or_three_values(self):
+        """Test positions with too few or too many values are rejected."""
+        for coordinates in ([-81.5], [-81.5, 30.1, 12.0, 1.0]):
+            with pytest.raises(ValidationError):
+                geometry_adapter.validate_python(
+                    {"type": "Point", "coordinates": coordinates}
+                )
+
+    def test_line_string_needs_two_positions(self):
+        """Test LineString requires at least two positions."""
+        with pytest.raises(ValidationError):
+            geometry_adapter.validate_python(
+                {"type": "LineString", "coordinates": [[-81.5, 30.1]]}
+            )
+
+
+class TestLargeGeometry:
+    """Test geometries above MAX_VALIDATED_COORDINATES are only spot-checked."""
+
+    @staticmethod
+    def line_coordinates(count):
+        return [[-81.0 + i * 1e-6, 30.0] for i in range(count)]
+
+    def test_count_positions(self):
+        """Test positions are counted at every nesting depth."""
+        assert count_positions([-81.5, 30.1]) == 1
+        assert count_positions([[-81.5, 30.1], [-81.6, 30.2]]) == 2
+        assert count_positions([[[0, 0], [1, 1]], [[2, 2], [3, 3], [4, 4]]]) == 5
+        assert count_positions(None) == 0
+
+    def test_is_position_list(self):
+        """Test the structural check used for positions past the sample."""
+        assert is_position_list([[-81.5, 30.1], [-81, 30, 12.0]])
+        assert is_position_list([])
+        assert not is_position_list([[-81.5, 30.1], ["x", 30.1]])
+        assert not is_position_list([[-81.5, 30.1], None])
+        assert not is_position_list("not_a_list")
+
+    def test_small_geometry_fully_validated(self):
+        """Test geometries at the limit keep the fully validated model."""
+        geometry = geometry_adapter.validate_python(
+            {
+                "type": "LineString",
+                "coordinates": self.line_coordinates(MAX_VALIDATED_COORDINATES),
+            }
+        )
+
+        assert isinstance(geometry, LineString)
+
+    def test_large_geometry_sampled(self):
+        """Test geometries above the limit keep their coordinates unchanged."""
+        coordinates = self.line_coordinates(MAX_VALIDATED_COORDINATES + 1)
+
+        geometry = geometry_adapter.validate_python(
+            {"type": "LineString", "coordinates": coordinates}
+        )
+
+        assert isinstance(geometry, SampledGeometry)
+        assert geometry.type == "LineString"
+        assert geometry.coordinates == coordinates
+
+    def test_large_geometry_round_trip(self):
+        """Test a sampled geometry serializes back to the same GeoJSON."""
+        geometry_data = {
+            "type": "MultiLineString",
+            "coordinates": [self.line_coordinates(MAX_VALIDATED_COORDINATES + 1)],
+        }
+
+        geometry = geometry_adapter.validate_python(geometry_data)
+
+        assert isinstance(geometry, SampledGeometry)
+        assert geometry_adapter.dump_python(geometry) == geometry_data
+
+    def test_large_geometry_invalid_sample(self):
+        """Test invalid leading coordinates are still rejected."""
+        coordinates = [["not_a_number", 30.0]] * (MAX_VALIDATED_COORDINATES + 1)
+
+        with pytest.raises(ValidationError) as exc_info:
+            geometry_adapter.validate_python(
+                {"type": "LineString", "coordinates": coordinates}
+            )
+
+        assert "LineString.coordinates.0.0" in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        "bad_position", ["garbage", None, {}, [-81.0], [-81.0, "30.0"], [1, 2, 3, 4]]
+    )
+    def test_large_geometry_invalid_tail(self, bad_position):
+        """Test malformed positions past the validated sample are rejected."""
+        coordinates = self.line_coordinates(MAX_VALIDATED_COORDINATES + 1)
+        coordinates.append(bad_position)
+
+        with pytest.raises(ValidationError) as exc_info:
+            geometry_adapter.validate_python(
+                {"type": "LineString", "coordinates": coordinates}
+            )
+
+        assert "LineString.coordinates: Input should be a list of positions" in str(
+            exc_info.value
+        )
+
+    def test_large_multi_line_string_invalid_part(self):
+        """Test parts past the validated sample are checked too."""
+        parts = [self.line_coordinates(200) for _ in range(GEOMETRY_SAMPLE_SIZE + 1)]
+        parts[-1].append(None)
+
+        with pytest.raises(ValidationError) as exc_info:
+            geometry_adapter.validate_python(
+                {"type": "MultiLineString", "coordinates": parts}
+            )
+
+        assert f"MultiLineString.coordinates.{GEOMETRY_SAMPLE_SIZE}:" in str(
+            exc_info.value
+        )
+
+    def test_large_geometry_invalid_type(self):
+        """Test the type tag is validated for large geometries."""
+        coordinates = self.line_coordinates(MAX_VALIDATED_COORDINATES + 1)
+
+        with pytest.raises(ValidationError):
+            geometry_adapter.validate_python(
+                {"type": "InvalidType", "coordinates": coordinates}
+            )
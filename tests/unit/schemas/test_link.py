@@ -5,6 +5,11 @@ Tests for Link Pydantic schemas.
 import pytest
 from pydantic import ValidationError
 
+from app.schemas.geometry import (
+    MAX_VALIDATED_COORDINATES,
+    LineString,
+    SampledLineString,
+)
 from app.schemas.link import LinkBase, LinkCreate, LinkList, LinkResponse, LinkUpdate
 
 
@@ -209,7 +214,7 @@ class TestLinkSchemas:
         assert all(isinstance(item, LinkResponse) for item in link_list.items)
 
     def test_geometry_field(self):
-        """Test geometry field accepts dict."""
+        """Test geometry field accepts a GeoJSON dict."""
         geometry_data = {
             "type": "LineString",
             "coordinates": [[-81.3792, 30.3322], [-81.3791, 30.3325]],
@@ -217,23 +222,61 @@ class TestLinkSchemas:
 
         link = LinkCreate(link_id=12345, geometry=geometry_data)
 
-        assert link.geometry == geometry_data
         assert link.geometry is not None
-        assert link.geometry["type"] == "LineString"
+        assert isinstance(link.geometry, LineString)
+        assert link.geometry.type == "LineString"
+        assert link.geometry.coordinates == [(-81.3792, 30.3322), (-81.3791, 30.3325)]
 
     def test_link_create_with_invalid_geometry(self):
-        """Test LinkCreate with invalid geometry format."""
-        # Test with invalid geometry structure
+        """Test LinkCreate rejects an unknown geometry type."""
         invalid_geometry = {
             "type": "InvalidType",  # Not a valid GeoJSON type
             "coordinates": "not_a_list",
         }
 
-        link = LinkCreate(link_id=12345, geometry=invalid_geometry)
+        with pytest.raises(ValidationError) as exc_info:
+            LinkCreate(link_id=12345, geometry=invalid_geometry)
+
+        errors = exc_info.value.errors()
+        assert errors[0]["type"] == "union_tag_invalid"
+
+    @pytest.mark.parametrize(
+        "geometry_data",
+        [
+            {"type": "Point", "coordinates": [-81.3792, 30.3322]},
+            {
+                "type": "MultiLineString",
+                "coordinates": [[[-81.3792, 30.3322], [-81.3791, 30.3325]]],
+            },
+        ],
+    )
+    def test_link_create_rejects_non_line_string(self, geometry_data):
+        """Test links only accept LineString geometries."""
+        with pytest.raises(ValidationError) as exc_info:
+            LinkCreate(link_id=12345, geometry=geometry_data)
+
+        assert exc_info.value.errors()[0]["type"] == "union_tag_invalid"
+
+    def test_link_create_large_geometry_must_be_line_string(self):
+        """Test large geometries above the sampling limit must be LineStrings."""
+        line = [[-81.0 + i * 1e-6, 30.0] for i in range(MAX_VALIDATED_COORDINATES + 1)]
+
+        link = LinkCreate(
+            link_id=12345, geometry={"type": "LineString", "coordinates": line}
+        )
+        assert isinstance(link.geometry, SampledLineString)
 
-        # Should still create the object (validation is at API level)
-        assert link.geometry is not None
-        assert link.geometry["type"] == "InvalidType"
+        with pytest.raises(ValidationError):
+            LinkCreate(
+                link_id=12345,
+                geometry={"type": "LineString", "coordinates": line + ["garbage"]},
+            )
+
+        with pytest.raises(ValidationError):
+            LinkCreate(
+                link_id=12345,
+                geometry={"type": "MultiLineString", "coordinates": [line]},
+            )
 
     def test_link_create_boundary_values(self):
         """Test LinkCreate with boundary values."""